@@ -0,0 +1 @@
+"""Benchmarks for the Audi connect integration."""
@@ -0,0 +1,207 @@
+"""End-to-end benchmark of the Audi connect integration against the mock backend.
+
+Drives the config flow, ``async_setup_entry``, coordinator refreshes and entity
+fan-out for 1, 10 and 100 vehicles and reports setup time, poll time, state
+writes per second and the recorder rows per vehicle and per day they project to
+at the default scan interval.
+
+Requires Home Assistant, audiconnectpy and pytest-homeassistant-custom-component.
+Run from the repository root::
+
+    python -m benchmarks.bench_integration --vehicles 1 10 100 --polls 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import ExitStack, asynccontextmanager
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant import loader
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_PIN,
+    CONF_USERNAME,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+from custom_components.audiconnect.const import (
+    CONF_COUNTRY,
+    CONF_MODEL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+
+from .mock_backend import MockAudiBackend, MockAudiConnect
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+POLLS_PER_DAY = 24 * 60 // DEFAULT_SCAN_INTERVAL
+
+USER_INPUT = {
+    CONF_USERNAME: "bench@example.com",
+    CONF_PASSWORD: "password",
+    CONF_COUNTRY: "DE",
+    CONF_PIN: "1234",
+    CONF_MODEL: "e-tron",
+}
+
+
+@dataclass
+class BenchResult:
+    """Result of a benchmark run."""
+
+    vehicles: int
+    entities: int
+    setup: float
+    poll_mean: float
+    poll_p95: float
+    writes: int
+    writes_per_second: float
+    rows_per_vehicle_day: float
+
+    def __str__(self) -> str:
+        """Return a table row."""
+        return (
+            f"{self.vehicles:>8} {self.entities:>8} {self.setup:>9.3f}s "
+            f"{self.poll_mean:>9.3f}s {self.poll_p95:>9.3f}s "
+            f"{self.writes:>8} {self.writes_per_second:>10.0f}/s "
+            f"{self.rows_per_vehicle_day:>10.0f}"
+        )
+
+
+HEADER = (
+    f"{'vehicles':>8} {'entities':>8} {'setup':>10} "
+    f"{'poll mean':>10} {'poll p95':>10} {'writes':>8} {'writes/s':>12} "
+    f"{'rows/veh/d':>10}"
+)
+
+
+@asynccontextmanager
+async def async_bench_hass(patches: dict[str, Any]) -> AsyncIterator[HomeAssistant]:
+    """Return a Home Assistant instance with patched integration modules.
+
+    The configuration directory is temporary, with a link to the integration,
+    so storage files and exports are not written into the repository.
+    """
+    with TemporaryDirectory() as config_dir:
+        (Path(config_dir) / "custom_components").symlink_to(
+            REPO_ROOT / "custom_components", target_is_directory=True
+        )
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            with ExitStack() as stack:
+                for target, new in patches.items():
+                    stack.enter_context(patch(target, new))
+                yield hass
+
+
+async def async_setup_integration(
+    hass: HomeAssistant, user_input: dict[str, Any] = USER_INPUT
+) -> ConfigEntry:
+    """Run the config flow, which sets up the entry."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}, data=user_input
+    )
+    await hass.async_block_till_done()
+    return result["result"]
+
+
+async def async_measure(
+    hass: HomeAssistant,
+    vehicles: int,
+    polls: int,
+    before_poll: Callable[[], None] | None = None,
+    user_input: dict[str, Any] = USER_INPUT,
+) -> BenchResult:
+    """Measure setup, polls and state writes."""
+    writes = 0
+
+    @callback
+    def _count_writes(event: Event) -> None:
+        nonlocal writes
+        writes += 1
+
+    start = time.perf_counter()
+    entry = await async_setup_integration(hass, user_input)
+    setup = time.perf_counter() - start
+
+    coordinator = entry.runtime_data
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _count_writes)
+    durations = []
+    for _ in range(polls):
+        if before_poll:
+            before_poll()
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        durations.append(time.perf_counter() - start)
+    await hass.async_block_till_done()
+
+    ordered = sorted(durations)
+    return BenchResult(
+        vehicles=vehicles,
+        entities=len(hass.states.async_entity_ids()),
+        setup=setup,
+        poll_mean=statistics.fmean(durations),
+        poll_p95=ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        writes=writes,
+        writes_per_second=writes / sum(durations),
+        rows_per_vehicle_day=writes / vehicles / polls * POLLS_PER_DAY,
+    )
+
+
+async def async_bench(vehicles: int, polls: int, **backend_options) -> BenchResult:
+    """Benchmark setup and polls for a number of vehicles."""
+    backend = MockAudiBackend(vehicles=vehicles, **backend_options)
+    await backend.start()
+    factory = partial(MockAudiConnect, base_url=backend.url)
+    try:
+        async with async_bench_hass(
+            {
+                "custom_components.audiconnect.coordinator.AudiConnect": factory,
+                "custom_components.audiconnect.config_flow.AudiConnect": factory,
+            }
+        ) as hass:
+            return await async_measure(hass, vehicles, polls, backend.tick)
+    finally:
+        await backend.stop()
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run benchmarks."""
+    print(HEADER)
+    for vehicles in args.vehicles:
+        result = await async_bench(
+            vehicles,
+            args.polls,
+            latency=args.latency,
+            error_rate=args.error_rate,
+            padding=args.padding,
+        )
+        print(result)
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--polls", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--padding", type=int, default=0)
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare the standard library and orjson codecs on vehicle payloads.
+
+Decodes and encodes selective status payloads shaped like the backend ones,
+and computes the sorted encoding used for change detection, with the
+standard library ``json`` module (the codec used before) and with the
+orjson-backed helpers of Home Assistant used by the integration.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_json --vehicles 1 10 100 --padding 0 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes, json_bytes_sorted
+from homeassistant.util.json import json_loads
+
+from .mock_backend import status_payload
+
+HEADER = (
+    f"{'vehicles':>8} {'padding':>8} {'bytes':>8} {'codec':>7} "
+    f"{'decode µs':>10} {'encode µs':>10} {'sorted µs':>10}"
+)
+
+CODECS: dict[str, tuple[Callable[[Any], Any], ...]] = {
+    "json": (
+        json.loads,
+        json.dumps,
+        lambda data: json.dumps(data, sort_keys=True, default=str),
+    ),
+    "orjson": (json_loads, json_bytes, json_bytes_sorted),
+}
+
+
+def _per_payload(
+    function: Callable[[Any], Any], items: list[Any], rounds: int
+) -> float:
+    """Return the mean time per item in microseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            function(item)
+    return (time.perf_counter() - start) / rounds / len(items) * 1e6
+
+
+def bench(vehicles: int, padding: int, rounds: int) -> list[str]:
+    """Benchmark both codecs on the payloads of a number of vehicles."""
+    payloads = [status_payload(index, 0, padding) for index in range(vehicles)]
+    raw = [json.dumps(payload) for payload in payloads]
+    size = sum(len(text) for text in raw) // vehicles
+    lines = []
+    for codec, (loads, dumps, dumps_sorted) in CODECS.items():
+        decode = _per_payload(loads, raw, rounds)
+        encode = _per_payload(dumps, payloads, rounds)
+        encode_sorted = _per_payload(dumps_sorted, payloads, rounds)
+        lines.append(
+            f"{vehicles:>8} {padding:>8} {size:>8} {codec:>7} "
+            f"{decode:>10.1f} {encode:>10.1f} {encode_sorted:>10.1f}"
+        )
+    return lines
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--padding", type=int, nargs="+", default=[0, 2000])
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+    print(HEADER)
+    for vehicles in args.vehicles:
+        for padding in args.padding:
+            for line in bench(vehicles, padding, args.rounds):
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
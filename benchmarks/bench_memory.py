@@ -0,0 +1,100 @@
+"""Memory used by the entities of the Audi connect integration.
+
+Sets up the integration against the mock backend and reports the memory
+allocated by the setup, per vehicle and per entity, with the number of distinct
+device info objects held by the entities (one per vehicle when shared). The
+last column estimates the memory a device info dict per entity would take.
+
+Requires Home Assistant, audiconnectpy and pytest-homeassistant-custom-component.
+Run from the repository root::
+
+    python -m benchmarks.bench_memory --vehicles 1 10 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from functools import partial
+
+from homeassistant.helpers.entity_component import DATA_INSTANCES
+
+from custom_components.audiconnect.entity import AudiEntity
+
+from .bench_integration import async_bench_hass, async_setup_integration
+from .mock_backend import MockAudiBackend, MockAudiConnect
+
+HEADER = (
+    f"{'vehicles':>8} {'entities':>8} {'setup KiB':>10} {'KiB/veh':>8} "
+    f"{'B/entity':>9} {'dev infos':>10} {'per-entity KiB':>15}"
+)
+
+
+def _copies_size(entities: list[AudiEntity]) -> int:
+    """Return the memory taken by a copy of the device info per entity."""
+    tracemalloc.start()
+    copies = [
+        {**entity.device_info, "identifiers": set(entity.device_info["identifiers"])}
+        for entity in entities
+    ]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del copies
+    return size
+
+
+async def async_bench(vehicles: int) -> str:
+    """Set up the integration and measure the memory of its entities."""
+    backend = MockAudiBackend(vehicles=vehicles)
+    await backend.start()
+    factory = partial(MockAudiConnect, base_url=backend.url)
+    try:
+        async with async_bench_hass(
+            {
+                "custom_components.audiconnect.coordinator.AudiConnect": factory,
+                "custom_components.audiconnect.config_flow.AudiConnect": factory,
+            }
+        ) as hass:
+            gc.collect()
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            await async_setup_integration(hass)
+            gc.collect()
+            setup = tracemalloc.get_traced_memory()[0] - baseline
+            tracemalloc.stop()
+
+            entities = [
+                entity
+                for component in hass.data[DATA_INSTANCES].values()
+                for entity in component.entities
+                if isinstance(entity, AudiEntity)
+            ]
+            device_infos = len({id(entity.device_info) for entity in entities})
+            return (
+                f"{vehicles:>8} {len(entities):>8} {setup / 1024:>10.0f} "
+                f"{setup / 1024 / vehicles:>8.1f} "
+                f"{setup / max(len(entities), 1):>9.0f} {device_infos:>10} "
+                f"{_copies_size(entities) / 1024:>15.1f}"
+            )
+    finally:
+        await backend.stop()
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run benchmarks."""
+    print(HEADER)
+    for vehicles in args.vehicles:
+        print(await async_bench(vehicles))
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, nargs="+", default=[1, 10, 100])
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Reload stress test of the Audi connect integration against the mock backend.
+
+Sets up a config entry and reloads it repeatedly, as an options change does,
+reporting the traced memory, the open file descriptors and the registered
+services every ``--every`` reloads. Both counts should stay flat once warm.
+
+Requires Home Assistant, audiconnectpy and pytest-homeassistant-custom-component.
+Run from the repository root::
+
+    python -m benchmarks.bench_reload --vehicles 10 --reloads 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import os
+import time
+import tracemalloc
+from functools import partial
+
+from custom_components.audiconnect.const import DOMAIN
+
+from .bench_integration import async_bench_hass, async_setup_integration
+from .mock_backend import MockAudiBackend, MockAudiConnect
+
+HEADER = (
+    f"{'reloads':>8} {'memory KiB':>11} {'delta KiB':>10} {'fds':>6} "
+    f"{'services':>9} {'reload ms':>10}"
+)
+
+
+def _open_fds() -> int:
+    """Return the number of open file descriptors of the process."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except FileNotFoundError:
+        return -1
+
+
+async def async_bench(vehicles: int, reloads: int, every: int) -> None:
+    """Reload an entry and print memory and descriptors along the way."""
+    backend = MockAudiBackend(vehicles=vehicles)
+    await backend.start()
+    factory = partial(MockAudiConnect, base_url=backend.url)
+    try:
+        async with async_bench_hass(
+            {
+                "custom_components.audiconnect.coordinator.AudiConnect": factory,
+                "custom_components.audiconnect.config_flow.AudiConnect": factory,
+            }
+        ) as hass:
+            entry = await async_setup_integration(hass)
+            tracemalloc.start()
+            gc.collect()
+            baseline = tracemalloc.get_traced_memory()[0]
+            print(HEADER)
+            durations = []
+            for reload in range(1, reloads + 1):
+                start = time.perf_counter()
+                assert await hass.config_entries.async_reload(entry.entry_id)
+                await hass.async_block_till_done()
+                durations.append(time.perf_counter() - start)
+                if reload % every:
+                    continue
+                gc.collect()
+                memory = tracemalloc.get_traced_memory()[0]
+                print(
+                    f"{reload:>8} {memory / 1024:>11.0f} "
+                    f"{(memory - baseline) / 1024:>10.0f} {_open_fds():>6} "
+                    f"{len(hass.services.async_services().get(DOMAIN, {})):>9} "
+                    f"{sum(durations) / len(durations) * 1000:>10.1f}"
+                )
+                durations = []
+            tracemalloc.stop()
+
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            print(
+                "after unload: "
+                f"{len(hass.services.async_services().get(DOMAIN, {}))} services"
+            )
+    finally:
+        await backend.stop()
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=10)
+    parser.add_argument("--reloads", type=int, default=500)
+    parser.add_argument("--every", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(async_bench(args.vehicles, args.reloads, args.every))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Deterministic setup and refresh benchmark replaying recorded cassettes.
+
+Cassettes are recorded by the integration when the "Record HTTP cassettes of
+poll cycles" option is enabled, in ``<config>/audiconnect/cassettes``. Unlike
+``bench_integration``, the real audiconnectpy client parses the recorded
+payloads, so the results reflect the payload shapes of each model.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_replay cassettes/standard_*.json cassettes/e-tron_*.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import re
+from pathlib import Path
+from typing import Any
+
+from .bench_integration import HEADER, USER_INPUT, async_bench_hass, async_measure
+from .cassettes import CassetteBackend, ReplaySession
+
+_ALIAS = re.compile(r"REDACTED\d{9}")
+_INTEGRATION = "custom_components.audiconnect"
+
+
+async def async_replay(path: Path, polls: int) -> str:
+    """Benchmark setup and polls replaying a cassette."""
+    backend = CassetteBackend(path)
+    await backend.start()
+
+    def session_factory(hass: Any, *args: Any, **kwargs: Any) -> ReplaySession:
+        kwargs.pop("auto_cleanup", None)
+        return ReplaySession(backend, **kwargs)
+
+    vehicles = len(
+        {
+            alias
+            for exchange in backend.cassette["exchanges"]
+            for alias in _ALIAS.findall(exchange["url"])
+        }
+    )
+    try:
+        async with async_bench_hass(
+            {
+                f"{_INTEGRATION}.{module}.async_create_clientsession": session_factory
+                for module in ("coordinator", "config_flow")
+            }
+        ) as hass:
+            result = await async_measure(
+                hass,
+                vehicles,
+                polls,
+                user_input={**USER_INPUT, "model": backend.model},
+            )
+    finally:
+        await backend.stop()
+    return f"{result} {backend.model:>10} misses={backend.misses}"
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run benchmarks."""
+    print(f"{HEADER} {'model':>10}")
+    for path in args.cassettes:
+        print(await async_replay(path, args.polls))
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassettes", type=Path, nargs="+")
+    parser.add_argument("--polls", type=int, default=10)
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Offline replay of cassettes recorded by the integration.
+
+``CassetteBackend`` serves the recorded exchanges from a local aiohttp
+application. Exchanges are matched on method, host and path; when an endpoint
+was called several times, responses are served in recorded order and the last
+one is repeated.
+
+``ReplaySession`` is a client session that rewrites every absolute url to the
+local backend (``https://host/path`` becomes ``http://127.0.0.1:port/host/path``)
+so the real audiconnectpy client can run against a cassette.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession, web
+from yarl import URL
+
+
+def _key(method: str, url: URL) -> tuple[str, str]:
+    """Return the matching key of a request."""
+    return method.upper(), f"{url.host}{url.path}".rstrip("/")
+
+
+class CassetteBackend:
+    """Local aiohttp application replaying a cassette."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize."""
+        self.cassette: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        self.model: str = self.cassette["model"]
+        self.misses = 0
+        self._runner: web.AppRunner | None = None
+        self._exchanges: defaultdict[tuple[str, str], list[dict]] = defaultdict(list)
+        self._served: defaultdict[tuple[str, str], int] = defaultdict(int)
+        for exchange in self.cassette["exchanges"]:
+            key = _key(exchange["method"], URL(exchange["url"]))
+            self._exchanges[key].append(exchange)
+        self.url = ""
+
+        self.app = web.Application()
+        self.app.router.add_route("*", "/{host}/{path:.*}", self._replay)
+
+    async def start(self) -> None:
+        """Start listening on a random local port."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        """Stop the backend."""
+        if self._runner:
+            await self._runner.cleanup()
+
+    def rewrite(self, url: URL) -> URL:
+        """Return the local url of an absolute url."""
+        if not url.is_absolute() or url.host == "127.0.0.1":
+            return url
+        return URL(self.url).with_path(f"/{url.host}{url.path}").with_query(url.query)
+
+    async def _replay(self, request: web.Request) -> web.Response:
+        """Serve the next recorded response of an endpoint."""
+        key = (
+            request.method,
+            f"{request.match_info['host']}/{request.match_info['path']}".rstrip("/"),
+        )
+        if not (exchanges := self._exchanges.get(key)):
+            self.misses += 1
+            return web.json_response({"error": "not recorded"}, status=404)
+
+        exchange = exchanges[min(self._served[key], len(exchanges) - 1)]
+        self._served[key] += 1
+
+        headers = dict(exchange["headers"])
+        content_type = headers.pop("content-type", "application/json")
+        if location := headers.get("location"):
+            headers["location"] = str(self.rewrite(URL(location)))
+        body = exchange["body"]
+        return web.Response(
+            status=exchange["status"] or 200,
+            headers=headers,
+            text=body if isinstance(body, str) or body is None else json.dumps(body),
+            content_type=content_type.split(";")[0],
+        )
+
+
+class ReplaySession(ClientSession):
+    """Client session sending every request to a cassette backend."""
+
+    def __init__(self, backend: CassetteBackend, **kwargs: Any) -> None:
+        """Initialize."""
+        super().__init__(**kwargs)
+        self._backend = backend
+
+    async def _request(
+        self, method: str, str_or_url: str | URL, **kwargs: Any
+    ) -> ClientResponse:
+        """Send the request to the backend."""
+        return await super()._request(
+            method, self._backend.rewrite(URL(str_or_url)), **kwargs
+        )
@@ -0,0 +1,416 @@
+"""Offline stand-in for the Audi connect backend.
+
+The backend is a local aiohttp application serving the identity, vehicle list,
+selective status, parking position and action endpoints for N simulated
+vehicles, with configurable latency, error rate and payload size.
+
+``MockAudiConnect`` replaces ``audiconnectpy.AudiConnect`` in the integration
+and talks to the backend through the session created by the coordinator, so
+requests go through the same trace configs as in production.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, web
+from audiconnectpy import AudiException
+
+BASE_VIN = "WAUZZZ4G0EN"
+
+_CAMEL_1 = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_2 = re.compile(r"([a-z0-9])([A-Z])")
+
+
+def snake_case(name: str) -> str:
+    """Return snake case of a camel case key."""
+    return _CAMEL_2.sub(r"\1_\2", _CAMEL_1.sub(r"\1_\2", name)).lower()
+
+
+def vin_of(index: int) -> str:
+    """Return a deterministic vin."""
+    return f"{BASE_VIN}{index:06d}"
+
+
+def status_payload(index: int, sequence: int, padding: int = 0) -> dict[str, Any]:
+    """Return a selective status payload as sent by the backend."""
+    timestamp = f"2024-01-01T{sequence % 24:02d}:00:00Z"
+    soc = 20 + (sequence * 7 + index) % 80
+    payload: dict[str, Any] = {
+        "access": {
+            "accessStatus": {
+                "value": {
+                    "overallStatus": "safe",
+                    "doorLockStatus": "locked",
+                    "carCapturedTimestamp": timestamp,
+                }
+            }
+        },
+        "charging": {
+            "batteryStatus": {
+                "value": {
+                    "currentSOC_pct": soc,
+                    "cruisingRangeElectric_km": soc * 4,
+                    "carCapturedTimestamp": timestamp,
+                }
+            },
+            "chargingStatus": {
+                "value": {
+                    "chargingState": "charging" if soc < 80 else "notReadyForCharging",
+                    "chargePower_kw": 11.0 if soc < 80 else 0.0,
+                    "chargeRate_kmph": 60 if soc < 80 else 0,
+                    "chargeType": "ac",
+                    "remainingChargingTime": (80 - soc) * 6,
+                    "carCapturedTimestamp": timestamp,
+                }
+            },
+            "chargeSettings": {"value": {"targetSOC_pct": 80}},
+            "plugStatus": {"value": {"ledColor": "green"}},
+        },
+        "climatisation": {
+            "climatisationSettings": {"value": {"targetTemperature_C": 21.5}},
+            "climatisationStatus": {
+                "value": {
+                    "climatisationState": "off",
+                    "remainingClimatisationTime_min": 0,
+                }
+            },
+        },
+        "measurements": {
+            "odometerStatus": {"value": {"odometer": 10000 + sequence * 12 + index}},
+            "rangeStatus": {
+                "value": {"electricRange": soc * 4, "gasolineRange": 350 + index}
+            },
+            "fuelLevelStatus": {
+                "value": {
+                    "currentFuelLevel_pct": 60,
+                    "primaryEngineType": "electric",
+                    "secondaryEngineType": "gasoline",
+                }
+            },
+            "temperatureBatteryStatus": {
+                "value": {
+                    "temperatureHvBatteryMax_K": 295.15 + (sequence % 3) * 0.05,
+                    "temperatureHvBatteryMin_K": 294.15 + (sequence % 3) * 0.05,
+                }
+            },
+        },
+        "vehicleHealthInspection": {
+            "maintenanceStatus": {
+                "value": {
+                    "inspectionDue_days": 200,
+                    "inspectionDue_km": 15000,
+                    "oilServiceDue_days": 300,
+                    "oilServiceDue_km": 20000,
+                }
+            }
+        },
+        "oilLevel": {
+            "oilLevelStatus": {
+                "value": {"value": True, "carCapturedTimestamp": timestamp}
+            }
+        },
+        "vehicleLights": {
+            "lightsStatus": {"value": {"lights": {"left": False, "right": False}}}
+        },
+    }
+    if padding:
+        payload["userCapabilities"] = {
+            "capabilitiesStatus": {
+                "value": [
+                    {
+                        "id": f"capability{index:05d}",
+                        "status": [1001],
+                        "userDisabled": False,
+                    }
+                    for index in range(padding // 64)
+                ]
+            }
+        }
+    return payload
+
+
+class MockAudiBackend:
+    """Local aiohttp application simulating the Audi backend."""
+
+    def __init__(
+        self,
+        vehicles: int = 1,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        padding: int = 0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize."""
+        self.vehicles = vehicles
+        self.latency = latency
+        self.error_rate = error_rate
+        self.padding = padding
+        self.sequence = 0
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_post("/token", self._token)
+        self.app.router.add_get("/vehicles", self._vehicles)
+        self.app.router.add_get("/vehicles/{vin}/selectivestatus", self._status)
+        self.app.router.add_get("/vehicles/{vin}/parkingposition", self._position)
+        self.app.router.add_get("/vehicles/{vin}/capabilities", self._capabilities)
+        self.app.router.add_post("/vehicles/{vin}/actions/{action}", self._action)
+
+    async def start(self) -> None:
+        """Start listening on a random local port."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        """Stop the backend."""
+        if self._runner:
+            await self._runner.cleanup()
+
+    def tick(self) -> None:
+        """Advance simulated vehicle data."""
+        self.sequence += 1
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Add latency and random errors."""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.json_response({"error": "simulated"}, status=500)
+        return await handler(request)
+
+    async def _token(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"access_token": "token", "token_type": "bearer", "expires_in": 3600}
+        )
+
+    async def _vehicles(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "data": [
+                    {
+                        "vin": vin_of(index),
+                        "core": {"modelYear": 2024},
+                        "media": {
+                            "shortName": f"Q4 e-tron {index}",
+                            "longName": f"Audi Q4 e-tron {index}",
+                        },
+                    }
+                    for index in range(self.vehicles)
+                ]
+            }
+        )
+
+    async def _status(self, request: web.Request) -> web.Response:
+        index = int(request.match_info["vin"][len(BASE_VIN) :])
+        payload = status_payload(index, self.sequence, self.padding)
+        if jobs := request.query.get("jobs"):
+            payload = {job: payload[job] for job in jobs.split(",") if job in payload}
+        return web.json_response(payload)
+
+    async def _position(self, request: web.Request) -> web.Response:
+        index = int(request.match_info["vin"][len(BASE_VIN) :])
+        timestamp = f"2024-01-01T{self.sequence % 24:02d}:00:00Z"
+        return web.json_response(
+            {
+                "data": {
+                    "lat": 48.76 + index * 0.001,
+                    "lon": 11.42 + self.sequence * 0.0001,
+                    "carCapturedTimestamp": timestamp,
+                }
+            }
+        )
+
+    async def _capabilities(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"capabilities": [{"id": "charging"}, {"id": "access"}]}
+        )
+
+    async def _action(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": {"requestID": "1"}}, status=202)
+
+
+def _namespace(value: Any) -> Any:
+    """Build attribute objects from a payload, unwrapping value nodes."""
+    if isinstance(value, dict):
+        if set(value) == {"value"}:
+            return _namespace(value["value"])
+        return SimpleNamespace(
+            **{snake_case(key): _namespace(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return [_namespace(item) for item in value]
+    return value
+
+
+def _to_dict(value: Any) -> Any:
+    """Return a namespace as dictionary."""
+    if isinstance(value, SimpleNamespace):
+        return {key: _to_dict(item) for key, item in vars(value).items()}
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    return value
+
+
+@dataclass
+class MockVehicle:
+    """Stand-in for audiconnectpy Vehicle."""
+
+    api: MockAudiConnect
+    vin: str
+    infos: SimpleNamespace
+
+    def __post_init__(self) -> None:
+        """Initialize empty domains."""
+        self.position = SimpleNamespace(latitude=None, longitude=None, last_access=None)
+        self.last_access = None
+        self.last_update = None
+        self.is_moving = False
+        self.api_levels: dict[str, int] = {}
+
+    def set_api_level(self, name: str, level: int) -> None:
+        """Set api level."""
+        self.api_levels[name] = level
+
+    async def async_get_selectivestatus(
+        self, jobs: list[str] | None = None
+    ) -> dict[str, Any]:
+        """Return raw selective status, of some jobs only if given."""
+        return await self.api.async_request(
+            "GET",
+            f"/vehicles/{self.vin}/selectivestatus",
+            params={"jobs": ",".join(jobs)} if jobs else None,
+        )
+
+    async def async_get_capabilities(self) -> dict[str, Any]:
+        """Return capabilities."""
+        return await self.api.async_request("GET", f"/vehicles/{self.vin}/capabilities")
+
+    async def async_update(self) -> None:
+        """Update status and position."""
+        status = await self.async_get_selectivestatus()
+        for name, domain in status.items():
+            setattr(self, snake_case(name), _namespace(domain))
+        await self.async_get_position()
+        self.last_update = self.access.access_status.car_captured_timestamp
+        self.last_access = self.last_update
+
+    async def async_get_position(self) -> None:
+        """Update position."""
+        position = await self.api.async_request(
+            "GET", f"/vehicles/{self.vin}/parkingposition"
+        )
+        self.position = SimpleNamespace(
+            latitude=position["data"]["lat"],
+            longitude=position["data"]["lon"],
+            last_access=position["data"]["carCapturedTimestamp"],
+        )
+
+    async def async_refresh_vehicle_data(self) -> None:
+        """Request a refresh from the vehicle."""
+        await self._async_action("refresh", True)
+
+    async def _async_action(self, action: str, mode: Any) -> None:
+        await self.api.async_request(
+            "POST", f"/vehicles/{self.vin}/actions/{action}", json={"mode": mode}
+        )
+
+    async def async_set_lock(self, mode: bool) -> None:
+        """Lock or unlock."""
+        await self._async_action("lock", mode)
+
+    async def async_set_climater(self, mode: bool) -> None:
+        """Start or stop climatisation."""
+        await self._async_action("climater", mode)
+
+    async def async_set_climater_temp(self, value: float) -> None:
+        """Set climatisation temperature."""
+        await self._async_action("climater_temp", value)
+
+    async def async_set_battery_charger(self, mode: bool) -> None:
+        """Start or stop charging."""
+        await self._async_action("charger", mode)
+
+    async def async_set_charger_max(self, value: float) -> None:
+        """Set max charge current."""
+        await self._async_action("charger_max", value)
+
+    async def async_set_pre_heating(self, mode: bool) -> None:
+        """Start or stop pre heating."""
+        await self._async_action("pre_heating", mode)
+
+    async def async_set_window_heating(self, mode: bool) -> None:
+        """Start or stop window heating."""
+        await self._async_action("window_heating", mode)
+
+    async def async_set_ventilation(self, mode: bool) -> None:
+        """Start or stop ventilation."""
+        await self._async_action("ventilation", mode)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return vehicle as dictionary."""
+        return {
+            key: _to_dict(value)
+            for key, value in vars(self).items()
+            if key not in ("api", "api_levels")
+        }
+
+
+class MockAudiConnect:
+    """Stand-in for audiconnectpy AudiConnect bound to a mock backend."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        username: str,
+        password: str,
+        country: str,
+        spin: str | None = None,
+        *,
+        base_url: str,
+        model: str = "standard",
+        unit_system: str = "metric",
+    ) -> None:
+        """Initialize."""
+        self.session = session
+        self.base_url = base_url
+        self.is_connected = False
+        self.vehicles: list[MockVehicle] = []
+
+    async def async_request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Send a request to the backend."""
+        async with self.session.request(
+            method, f"{self.base_url}{path}", **kwargs
+        ) as response:
+            if response.status >= 400:
+                raise AudiException(f"{method} {path}: {response.status}")
+            return await response.json()
+
+    async def async_login(self) -> None:
+        """Log in and load the vehicle list once."""
+        await self.async_request("POST", "/token", data={"grant_type": "password"})
+        self.is_connected = True
+        if not self.vehicles:
+            information = await self.async_get_information_vehicles()
+            self.vehicles = [
+                MockVehicle(self, item["vin"], _namespace(item))
+                for item in information["data"]
+            ]
+
+    async def async_get_information_vehicles(self) -> dict[str, Any]:
+        """Return vehicle list."""
+        return await self.async_request("GET", "/vehicles")
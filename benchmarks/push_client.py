@@ -0,0 +1,54 @@
+"""Send selective status updates to the push webhook of the integration.
+
+Posts payloads shaped like the backend selective status to the webhook of a
+config entry (shown in the "Other settings" step of the options once push
+updates are enabled) and reports the response status and round trip time.
+
+Run from the repository root::
+
+    python -m benchmarks.push_client http://homeassistant.local:8123/api/webhook/<id> \\
+        --vin WAUZZZ4G0EN000000 --count 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from aiohttp import ClientSession
+
+from .mock_backend import status_payload
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Post updates and print the results."""
+    async with ClientSession() as session:
+        for sequence in range(args.count):
+            start = time.perf_counter()
+            async with session.post(
+                args.url,
+                json={
+                    "vin": args.vin,
+                    "data": status_payload(0, sequence, args.padding),
+                },
+            ) as response:
+                await response.read()
+            elapsed = time.perf_counter() - start
+            print(f"{sequence:>4} {response.status} {elapsed * 1000:>8.1f} ms")
+            await asyncio.sleep(args.interval)
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url")
+    parser.add_argument("--vin", required=True)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--padding", type=int, default=0)
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
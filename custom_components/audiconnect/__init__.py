@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 
+from .const import CONF_PUSH, CONF_WEBHOOK_ID, DOMAIN
 from .coordinator import AudiDataUpdateCoordinator
-from .services import async_setup_services
+from .registry import async_get_vehicle_registry
+from .services import async_setup_services, async_unload_services
+from .webhook import async_setup_webhook
 
 type AudiConfigEntry = ConfigEntry[AudiDataUpdateCoordinator]
 
@@ -26,19 +30,64 @@ PLATFORMS: list[Platform] = [
 async def async_setup_entry(hass: HomeAssistant, entry: AudiConfigEntry) -> bool:
     """Set up Audi connect from a config entry."""
     coordinator = AudiDataUpdateCoordinator(hass, entry)
+    try:
+        await _async_setup_coordinator(hass, entry, coordinator)
+    except Exception:
+        await _async_release_coordinator(hass, coordinator)
+        raise
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    return True
+
+
+async def _async_setup_coordinator(
+    hass: HomeAssistant, entry: AudiConfigEntry, coordinator: AudiDataUpdateCoordinator
+) -> None:
+    """Refresh the coordinator and set up platforms, services and webhook."""
     await coordinator.async_config_entry_first_refresh()
     entry.runtime_data = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    await async_setup_services(hass, coordinator)
-    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    vins = {vehicle.vin for vehicle in coordinator.data}
+    coordinator.async_remove_devices(
+        {
+            vin
+            for device in dr.async_entries_for_config_entry(
+                dr.async_get(hass), entry.entry_id
+            )
+            if (vin := dict(device.identifiers).get(DOMAIN)) and vin not in vins
+        }
+    )
 
-    return True
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await async_setup_services(hass)
+    if entry.options.get(CONF_PUSH):
+        if CONF_WEBHOOK_ID not in entry.data:
+            hass.config_entries.async_update_entry(
+                entry,
+                data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()},
+            )
+        async_setup_webhook(hass, entry, entry.data[CONF_WEBHOOK_ID])
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: AudiConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, PLATFORMS
+    ):
+        await _async_release_coordinator(hass, entry.runtime_data)
+    return unload_ok
+
+
+async def _async_release_coordinator(
+    hass: HomeAssistant, coordinator: AudiDataUpdateCoordinator
+) -> None:
+    """Shut a coordinator down and forget it, with the services of the last."""
+    await coordinator.async_shutdown()
+    registry = async_get_vehicle_registry(hass)
+    registry.async_remove(coordinator)
+    if not registry.coordinators:
+        async_unload_services(hass)
+        hass.data.pop(DOMAIN)
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: AudiConfigEntry):
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import logging
 
+from audiconnectpy.vehicle import Vehicle
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass as dc,
     BinarySensorEntity,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AudiConfigEntry
@@ -283,12 +285,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary sensor."""
     coordinator = entry.runtime_data
-    entities = [
-        AudiBinarySensor(coordinator, vehicle, description)
-        for description in SENSOR_TYPES
-        for vehicle in coordinator.data
-    ]
-    async_add_entities(entities)
+
+    @callback
+    def async_add_vehicles(vehicles: list[Vehicle]) -> None:
+        """Add entities of vehicles."""
+        async_add_entities(
+            AudiBinarySensor(coordinator, vehicle, description)
+            for description in SENSOR_TYPES
+            for vehicle in vehicles
+        )
+
+    entry.async_on_unload(coordinator.async_add_vehicle_listener(async_add_vehicles))
 
 
 class AudiBinarySensor(AudiEntity, BinarySensorEntity):
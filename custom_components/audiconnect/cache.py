@@ -0,0 +1,97 @@
+"""Cache of static Audi connect vehicle metadata requested by diagnostics."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+CACHE_TTL = timedelta(days=7)
+
+
+class MetadataCache:
+    """Persisted cache with a time to live, keyed per account or per VIN.
+
+    Only metadata requested by the integration itself is cached. The vehicle
+    list loaded at login is kept by audiconnectpy and still fetched each time.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, ttl: timedelta = CACHE_TTL
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.ttl = ttl
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.metadata"
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the cached metadata."""
+        if data := await self._store.async_load():
+            self._entries = data
+
+    async def async_get(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], vin: str | None = None
+    ) -> Any:
+        """Return cached metadata, fetching it when missing or expired."""
+        cache_key = f"{vin}:{key}" if vin else key
+        now = dt_util.utcnow()
+        if (entry := self._entries.get(cache_key)) and (
+            now - dt_util.parse_datetime(entry["fetched"]) < self.ttl
+        ):
+            self.hits += 1
+            return entry["data"]
+
+        self.misses += 1
+        data = await fetch()
+        if isinstance(data, dict | list):
+            self._entries[cache_key] = {"fetched": now.isoformat(), "data": data}
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return data
+
+    @callback
+    def async_invalidate(self, vin: str | None = None) -> None:
+        """Forget the metadata of a vehicle, or everything."""
+        if vin is None:
+            self._entries = {}
+        else:
+            self._entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if not key.startswith(f"{vin}:")
+            }
+        _LOGGER.debug("Metadata cache invalidated")
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def async_save(self) -> None:
+        """Write the data now, cancelling a delayed save."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to persist."""
+        return self._entries
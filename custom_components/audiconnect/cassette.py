@@ -0,0 +1,265 @@
+"""Record redacted HTTP exchanges of poll cycles."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceRequestChunkSentParams,
+    TraceRequestEndParams,
+    TraceRequestRedirectParams,
+    TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import save_json
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+from multidict import CIMultiDictProxy
+from yarl import URL
+
+from .const import DOMAIN, TO_REDACT
+
+_LOGGER = logging.getLogger(__name__)
+
+CASSETTE_LIMIT = 10
+CASSETTE_VERSION = 1
+REDACTED = "**REDACTED**"
+SENSITIVE_KEYS = TO_REDACT | {
+    "access_token",
+    "code",
+    "code_verifier",
+    "csrf",
+    "hmac",
+    "id_token",
+    "refresh_token",
+    "state",
+    "token",
+}
+KEEP_HEADERS = {"content-type", "etag", "last-modified", "location"}
+
+
+def _redact(value: Any) -> Any:
+    """Redact sensitive keys and keep value types so payloads can be replayed."""
+    if isinstance(value, dict):
+        return {
+            key: (
+                _redacted_value(item)
+                if key in SENSITIVE_KEYS and key != "vin"
+                else _redact(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+def _redacted_value(value: Any) -> Any:
+    """Return a placeholder of the same type."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int | float):
+        return 0
+    if isinstance(value, dict | list):
+        return _redact(value)
+    return REDACTED
+
+
+def _redact_params(params: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Redact the values of sensitive url parameters."""
+    return [(key, REDACTED if key in SENSITIVE_KEYS else item) for key, item in params]
+
+
+def redact_url(value: URL) -> str:
+    """Redact sensitive query and fragment parameters of a url.
+
+    OAuth redirects carry codes and tokens in the query or in the fragment.
+    Fragments that are not parameters are dropped.
+    """
+    if value.query_string:
+        value = value.with_query(_redact_params(value.query.items()))
+    if value.fragment:
+        fragment = (
+            parse_qsl(value.fragment, keep_blank_values=True)
+            if "=" in value.fragment
+            else []
+        )
+        value = value.with_fragment(
+            urlencode(_redact_params(fragment), safe="*") if fragment else None
+        )
+    return str(value)
+
+
+class CassetteRecorder:
+    """Capture request and response exchanges of a poll cycle."""
+
+    def __init__(self, hass: HomeAssistant, model: str, username: str) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.model = model
+        self._username = username
+        self._exchanges: list[SimpleNamespace] | None = None
+        self.directory = Path(hass.config.path(DOMAIN, "cassettes"))
+
+    def create_trace_config(self) -> TraceConfig:
+        """Return an aiohttp trace config."""
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._async_on_request_start)
+        trace_config.on_request_chunk_sent.append(self._async_on_request_chunk_sent)
+        trace_config.on_request_redirect.append(self._async_on_request_redirect)
+        trace_config.on_request_end.append(self._async_on_request_end)
+        trace_config.on_response_chunk_received.append(self._async_on_chunk_received)
+        return trace_config
+
+    def start(self) -> None:
+        """Start recording."""
+        self._exchanges = []
+
+    def discard(self) -> None:
+        """Stop recording without writing a cassette."""
+        self._exchanges = None
+
+    async def async_save(self, vins: list[str]) -> None:
+        """Stop recording and write the cassette."""
+        exchanges, self._exchanges = self._exchanges, None
+        if exchanges:
+            await self.hass.async_add_executor_job(self._write, exchanges, vins)
+
+    def _new_exchange(self, method: str, url: URL) -> SimpleNamespace:
+        exchange = SimpleNamespace(
+            method=method,
+            url=url,
+            request_body=bytearray(),
+            status=None,
+            headers={},
+            body=bytearray(),
+        )
+        if self._exchanges is not None:
+            self._exchanges.append(exchange)
+        return exchange
+
+    @staticmethod
+    def _headers(headers: CIMultiDictProxy[str]) -> dict[str, str]:
+        return {
+            key.lower(): value
+            for key, value in headers.items()
+            if key.lower() in KEEP_HEADERS
+        }
+
+    async def _async_on_request_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        """Open an exchange."""
+        context.exchange = None
+        if self._exchanges is not None:
+            context.exchange = self._new_exchange(params.method, params.url)
+
+    async def _async_on_request_chunk_sent(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestChunkSentParams,
+    ) -> None:
+        """Capture request body."""
+        if exchange := getattr(context, "exchange", None):
+            exchange.request_body.extend(params.chunk)
+
+    async def _async_on_request_redirect(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestRedirectParams,
+    ) -> None:
+        """Close the exchange on redirect and follow the location."""
+        if (exchange := getattr(context, "exchange", None)) is None:
+            return
+        exchange.status = params.response.status
+        exchange.headers = self._headers(params.response.headers)
+        location = URL(params.response.headers.get("Location", ""))
+        context.exchange = self._new_exchange(params.method, params.url.join(location))
+
+    async def _async_on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        """Capture response status and headers."""
+        if exchange := getattr(context, "exchange", None):
+            exchange.url = params.url
+            exchange.status = params.response.status
+            exchange.headers = self._headers(params.response.headers)
+
+    async def _async_on_chunk_received(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        """Capture response body."""
+        if exchange := getattr(context, "exchange", None):
+            exchange.body.extend(params.chunk)
+
+    def _write(self, exchanges: list[SimpleNamespace], vins: list[str]) -> None:
+        """Redact exchanges and write the cassette file."""
+        aliases = {vin: f"REDACTED{index:09d}" for index, vin in enumerate(vins)}
+        aliases[self._username] = REDACTED
+
+        def scrub(text: str) -> str:
+            for value, alias in aliases.items():
+                text = text.replace(value, alias)
+            return text
+
+        def header(key: str, value: str) -> str:
+            return scrub(redact_url(URL(value)) if key == "location" else value)
+
+        def body(raw: bytearray, keep_text: bool) -> Any:
+            if not raw:
+                return None
+            text = scrub(raw.decode("utf-8", errors="replace"))
+            try:
+                return _redact(json_loads(text))
+            except ValueError:
+                return text if keep_text else REDACTED
+
+        cassette = {
+            "version": CASSETTE_VERSION,
+            "model": self.model,
+            "recorded": dt_util.utcnow().isoformat(),
+            "exchanges": [
+                {
+                    "method": exchange.method,
+                    "url": scrub(redact_url(exchange.url)),
+                    "request_body": body(exchange.request_body, False),
+                    "status": exchange.status,
+                    "headers": {
+                        key: header(key, value)
+                        for key, value in exchange.headers.items()
+                    },
+                    "body": body(exchange.body, True),
+                }
+                for exchange in exchanges
+            ],
+        }
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / (
+            f"{self.model}_{dt_util.now().strftime('%Y%m%d%H%M%S')}.json"
+        )
+        save_json(str(path), cassette)
+        _LOGGER.debug("Cassette recorded in %s", path)
+
+        cassettes = sorted(self.directory.glob(f"{self.model}_*.json"))
+        for old in cassettes[:-CASSETTE_LIMIT]:
+            old.unlink()
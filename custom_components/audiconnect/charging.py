@@ -0,0 +1,309 @@
+"""Charging sessions of Audi connect vehicles."""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import Any
+
+from audiconnectpy.vehicle import Vehicle
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_BATTERY_CAPACITY,
+    CONF_TARIFFS,
+    DEFAULT_BATTERY_CAPACITY,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+SESSION_HISTORY = 50
+CHARGING_STATES = {"charging"}
+FORGETTING_FACTOR = 0.8
+DEFAULT_EFFICIENCY = 0.9
+MAX_SAMPLE_GAP = 6 * 3600
+
+
+def parse_tariffs(text: str) -> list[tuple[int, float]]:
+    """Parse "HH:MM price" lines into sorted (minute of day, price) pairs."""
+    tariffs = []
+    for line in text.splitlines():
+        if not (line := line.strip()):
+            continue
+        start, price = line.replace("=", " ").split()
+        hours, minutes = start.split(":")
+        tariffs.append((int(hours) * 60 + int(minutes), float(price)))
+    return sorted(tariffs)
+
+
+@dataclass
+class ChargingSession:
+    """Charging session with energy integrated from power samples."""
+
+    start: float
+    last_sample: float
+    start_soc: float | None = None
+    soc: float | None = None
+    power: float = 0.0
+    max_power: float = 0.0
+    energy: float = 0.0
+    cost: float = 0.0
+    charge_type: str | None = None
+    end: float | None = None
+    target_soc: float | None = None
+    weight: float = 0.0
+    sum_t: float = 0.0
+    sum_s: float = 0.0
+    sum_tt: float = 0.0
+    sum_ts: float = 0.0
+
+    def add_soc(self, timestamp: float, soc: float) -> None:
+        """Add a sample to the SOC model, older samples weighing less."""
+        hours = (timestamp - self.start) / 3600
+        self.weight = self.weight * FORGETTING_FACTOR + 1
+        self.sum_t = self.sum_t * FORGETTING_FACTOR + hours
+        self.sum_s = self.sum_s * FORGETTING_FACTOR + soc
+        self.sum_tt = self.sum_tt * FORGETTING_FACTOR + hours * hours
+        self.sum_ts = self.sum_ts * FORGETTING_FACTOR + hours * soc
+
+    @property
+    def soc_rate(self) -> float | None:
+        """Return the fitted charging speed in % per hour."""
+        variance = self.weight * self.sum_tt - self.sum_t * self.sum_t
+        if self.weight <= 1 or variance <= 1e-9:
+            return None
+        return (self.weight * self.sum_ts - self.sum_t * self.sum_s) / variance
+
+    def eta(self, capacity: float) -> datetime | None:
+        """Return the predicted time the target state of charge is reached."""
+        if self.end is not None or self.soc is None:
+            return None
+        target = self.target_soc or 100
+        if self.soc >= target:
+            return None
+        rate = self.soc_rate
+        if (rate is None or rate <= 0) and capacity and self.power > 0:
+            efficiency = (self.efficiency(capacity) or DEFAULT_EFFICIENCY * 100) / 100
+            rate = self.power * efficiency / capacity * 100
+        if rate is None or rate <= 0:
+            return None
+        return dt_util.utc_from_timestamp(
+            self.last_sample + (target - self.soc) / rate * 3600
+        )
+
+    @property
+    def duration(self) -> float:
+        """Return the duration in minutes."""
+        return ((self.end or self.last_sample) - self.start) / 60
+
+    @property
+    def average_power(self) -> float | None:
+        """Return the average power in kW."""
+        if (duration := self.duration) <= 0:
+            return None
+        return round(self.energy / (duration / 60), 2)
+
+    @property
+    def soc_gained(self) -> float | None:
+        """Return the state of charge gained in %."""
+        if self.soc is None or self.start_soc is None:
+            return None
+        return self.soc - self.start_soc
+
+    def efficiency(self, capacity: float) -> float | None:
+        """Return the energy stored in the battery over the energy delivered in %."""
+        if not capacity or not self.energy or (gained := self.soc_gained) is None:
+            return None
+        return round(min(100.0, gained * capacity / self.energy), 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the session."""
+        return {
+            "start": dt_util.utc_from_timestamp(self.start).isoformat(),
+            "end": self.end and dt_util.utc_from_timestamp(self.end).isoformat(),
+            "energy": round(self.energy, 3),
+            "cost": round(self.cost, 2),
+            "soc_gained": self.soc_gained,
+            "max_power": self.max_power,
+            "charge_type": self.charge_type,
+        }
+
+
+class ChargingSessions:
+    """Detect charging sessions and update their figures on each poll."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.capacity = float(
+            entry.options.get(CONF_BATTERY_CAPACITY, DEFAULT_BATTERY_CAPACITY)
+        )
+        self._tariffs = parse_tariffs(entry.options.get(CONF_TARIFFS, ""))
+        self._tariff_starts = [start for start, _ in self._tariffs]
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.charging"
+        )
+        self.current: dict[str, ChargingSession] = {}
+        self.history: dict[str, deque[ChargingSession]] = {}
+        self._restored: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the sessions in progress and the history."""
+        if data := await self._store.async_load():
+            self.current = {
+                vin: ChargingSession(**session)
+                for vin, session in data["current"].items()
+            }
+            self._restored = set(self.current)
+            self.history = {
+                vin: deque(
+                    (ChargingSession(**session) for session in sessions),
+                    maxlen=SESSION_HISTORY,
+                )
+                for vin, sessions in data["history"].items()
+            }
+
+    def latest(self, vin: str) -> ChargingSession | None:
+        """Return the session in progress or the last one."""
+        if session := self.current.get(vin):
+            return session
+        if history := self.history.get(vin):
+            return history[-1]
+        return None
+
+    def next_completion(self) -> datetime | None:
+        """Return the earliest predicted end of the sessions in progress."""
+        etas = [
+            eta
+            for session in self.current.values()
+            if (eta := session.eta(self.capacity))
+        ]
+        return min(etas, default=None)
+
+    def tariff(self, timestamp: float) -> float:
+        """Return the price per kWh at a time."""
+        if not self._tariffs:
+            return 0.0
+        local = dt_util.as_local(dt_util.utc_from_timestamp(timestamp))
+        index = bisect_right(self._tariff_starts, local.hour * 60 + local.minute)
+        return self._tariffs[index - 1][1]
+
+    @callback
+    def async_add_samples(self, vehicles: list[Vehicle]) -> None:
+        """Update the session of each vehicle with the latest sample."""
+        now = dt_util.utcnow().timestamp()
+        changed = False
+        for vehicle in vehicles:
+            try:
+                status = vehicle.charging.charging_status
+            except AttributeError:
+                continue
+            sample = _sample_time(status, now)
+            charging = status.charging_state in CHARGING_STATES or (
+                status.charging_state is True
+            )
+            power = getattr(status, "charge_power_kw", None) or 0.0
+            soc = _get(vehicle, "charging.battery_status.current_soc_pct")
+            target_soc = _get(vehicle, "charging.charge_settings.target_soc_pct")
+            session = self.current.get(vehicle.vin)
+
+            if charging and session is None:
+                _LOGGER.debug("Charging session started")
+                session = self.current[vehicle.vin] = ChargingSession(
+                    start=sample,
+                    last_sample=sample,
+                    start_soc=soc,
+                    soc=soc,
+                    power=power,
+                    max_power=power,
+                    charge_type=getattr(status, "charge_type", None),
+                    target_soc=target_soc,
+                )
+                if soc is not None:
+                    session.add_soc(sample, soc)
+                changed = True
+            elif session is not None:
+                if sample <= session.last_sample and charging:
+                    # Same sample as the last poll.
+                    continue
+                elapsed = min(sample - session.last_sample, MAX_SAMPLE_GAP)
+                if vehicle.vin in self._restored:
+                    # The power while Home Assistant was stopped is unknown.
+                    self._restored.discard(vehicle.vin)
+                elif elapsed > 0:
+                    energy = (session.power + power) / 2 * elapsed / 3600
+                    session.energy += energy
+                    session.cost += energy * self.tariff(sample)
+                session.last_sample = max(sample, session.last_sample)
+                session.power = power
+                session.max_power = max(session.max_power, power)
+                session.target_soc = target_soc
+                if soc is not None:
+                    session.soc = soc
+                    session.add_soc(session.last_sample, soc)
+                if not charging:
+                    _LOGGER.debug("Charging session ended")
+                    session.end = session.last_sample
+                    self.history.setdefault(
+                        vehicle.vin, deque(maxlen=SESSION_HISTORY)
+                    ).append(self.current.pop(vehicle.vin))
+                changed = True
+
+        if changed:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write the data now, cancelling a delayed save."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to persist."""
+        return {
+            "current": {vin: asdict(session) for vin, session in self.current.items()},
+            "history": {
+                vin: [asdict(session) for session in sessions]
+                for vin, sessions in self.history.items()
+            },
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return sessions for diagnostics."""
+        return {
+            "capacity": self.capacity,
+            "tariffs": self._tariffs,
+            "current": [session.as_dict() for session in self.current.values()],
+            "history": [
+                session.as_dict()
+                for sessions in self.history.values()
+                for session in sessions
+            ],
+        }
+
+
+def _get(vehicle: Vehicle, path: str) -> Any:
+    """Return a vehicle attribute or None."""
+    try:
+        return attrgetter(path)(vehicle)
+    except AttributeError:
+        return None
+
+
+def _sample_time(status: Any, default: float) -> float:
+    """Return when the vehicle captured a charging status."""
+    captured = getattr(status, "car_captured_timestamp", None)
+    if isinstance(captured, str):
+        captured = dt_util.parse_datetime(captured)
+    if isinstance(captured, datetime):
+        return captured.timestamp()
+    return default
@@ -9,29 +9,58 @@ from audiconnectpy import MODELS, AudiConnect, AudiException, AuthorizationError
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import webhook
 from homeassistant.const import CONF_PASSWORD, CONF_PIN, CONF_USERNAME
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import device_registry as dr, selector
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
+from .charging import parse_tariffs
 from .const import (
     API_LEVEL_CHARGER,
     API_LEVEL_CLIMATISATION,
     API_LEVEL_LOCK,
     API_LEVEL_VENTILATION,
     API_LEVEL_WINDOWSHEATING,
+    CONF_BATTERY_CAPACITY,
     CONF_COUNTRY,
+    CONF_DOMAIN_SCHEDULING,
+    CONF_HISTORY_SIZE,
+    CONF_HTTP_TRACING,
     CONF_MODEL,
+    CONF_MOVING_SCAN_INTERVAL,
+    CONF_PUSH,
+    CONF_PUSH_SCAN_INTERVAL,
+    CONF_QUIET_HOURS,
+    CONF_QUIET_SCAN_INTERVAL,
+    CONF_RECORD_CASSETTES,
     CONF_SCAN_INTERVAL,
+    CONF_SIGNIFICANT_MAX_AGE,
+    CONF_TARIFFS,
+    CONF_THRESHOLDS,
+    CONF_TRACKER_DISTANCE,
     CONF_VEHICLE,
+    CONF_VINS,
+    CONF_WEBHOOK_ID,
     COUNTRY_CODE,
+    DEFAULT_BATTERY_CAPACITY,
+    DEFAULT_HISTORY_SIZE,
     DEFAULT_MODEL,
+    DEFAULT_MOVING_SCAN_INTERVAL,
+    DEFAULT_PUSH_SCAN_INTERVAL,
+    DEFAULT_SIGNIFICANT_MAX_AGE,
+    DEFAULT_TRACKER_DISTANCE,
     DOMAIN,
+    MENU_CHARGING,
     MENU_OTHER,
     MENU_SAVE,
+    MENU_THRESHOLDS,
     MENU_VEHICLES,
+    MENU_VINS,
 )
+from .scheduler import parse_windows
+from .sensor import SENSOR_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,15 +99,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_USERNAME: user_input[CONF_USERNAME],
                     },
                 )
+                session = async_create_clientsession(self.hass, auto_cleanup=False)
                 api = AudiConnect(
-                    async_create_clientsession(self.hass),
+                    session,
                     user_input[CONF_USERNAME],
                     user_input[CONF_PASSWORD],
                     user_input[CONF_COUNTRY],
                     user_input.get(CONF_PIN),
                     model=user_input[CONF_MODEL],
                 )
-                await api.async_login()
+                try:
+                    await api.async_login()
+                finally:
+                    await session.close()
                 if not api.is_connected:
                     raise AuthorizationError(
                         "Unexpected error communicating with the Audi server"
@@ -103,7 +136,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         """Initialize the options flow."""
         self.config_entry = config_entry
         self._sel = None
-        self._data = {}
+        self._data = dict(config_entry.options)
 
     async def async_step_init(
         self,
@@ -111,7 +144,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Handle options flow."""
         return self.async_show_menu(
-            step_id="init", menu_options=[MENU_VEHICLES, MENU_OTHER, MENU_SAVE]
+            step_id="init",
+            menu_options=[
+                MENU_VEHICLES,
+                MENU_OTHER,
+                MENU_THRESHOLDS,
+                MENU_CHARGING,
+                MENU_VINS,
+                MENU_SAVE,
+            ],
         )
 
     async def async_step_vehicles(self, user_input=None) -> FlowResult():
@@ -126,7 +167,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             identifier[1]: entry.name
             for entry in entries
             for identifier in entry.identifiers
-            if identifier[0] == DOMAIN
+            if identifier[0] == DOMAIN and entry.entry_type is None
         }
         data_schema = vol.Schema(
             {
@@ -147,9 +188,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_other(self, user_input=None) -> FlowResult():
         """Handle a flow initialized by the user."""
+        errors = {}
         if user_input is not None:
-            self._data.update(user_input)
-            return await self.async_step_init()
+            try:
+                parse_windows(user_input.get(CONF_QUIET_HOURS, ""))
+            except ValueError:
+                errors[CONF_QUIET_HOURS] = "invalid_quiet_hours"
+            else:
+                self._data.update(user_input)
+                return await self.async_step_init()
 
         data_schema = self.add_suggested_values_to_schema(
             vol.Schema(
@@ -158,21 +205,226 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         selector.NumberSelectorConfig(
                             min=5, step=1, mode=selector.NumberSelectorMode.BOX
                         )
-                    )
+                    ),
+                    vol.Optional(
+                        CONF_DOMAIN_SCHEDULING, default=False
+                    ): selector.BooleanSelector(),
+                    vol.Optional(CONF_QUIET_HOURS, default=""): selector.TextSelector(),
+                    vol.Optional(
+                        CONF_QUIET_SCAN_INTERVAL, default=0
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="min",
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_TRACKER_DISTANCE, default=DEFAULT_TRACKER_DISTANCE
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="m",
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_MOVING_SCAN_INTERVAL,
+                        default=DEFAULT_MOVING_SCAN_INTERVAL,
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=15,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="s",
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_HISTORY_SIZE, default=DEFAULT_HISTORY_SIZE
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=100000,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(CONF_PUSH, default=False): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_PUSH_SCAN_INTERVAL, default=DEFAULT_PUSH_SCAN_INTERVAL
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=30,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="min",
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_HTTP_TRACING, default=False
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_RECORD_CASSETTES, default=False
+                    ): selector.BooleanSelector(),
+                }
+            ),
+            user_input or self.config_entry.options,
+        )
+
+        webhook_id = self.config_entry.data.get(CONF_WEBHOOK_ID)
+        return self.async_show_form(
+            step_id="other",
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders={
+                "webhook_path": (
+                    webhook.async_generate_path(webhook_id) if webhook_id else "-"
+                )
+            },
+            last_step=False,
+        )
+
+    async def async_step_thresholds(self, user_input=None) -> FlowResult():
+        """Set significant change thresholds of numeric sensors."""
+        if user_input is not None:
+            max_age = user_input.pop(CONF_SIGNIFICANT_MAX_AGE)
+            self._data.update(
+                {CONF_THRESHOLDS: user_input, CONF_SIGNIFICANT_MAX_AGE: max_age}
+            )
+            return await self.async_step_init()
+
+        thresholds = self.config_entry.options.get(CONF_THRESHOLDS, {})
+        schema = {
+            vol.Required(
+                description.key,
+                default=thresholds.get(description.key, description.significant_change),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    step="any",
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement=(
+                        "×"
+                        if description.significant_relative
+                        else description.native_unit_of_measurement
+                    ),
+                )
+            )
+            for description in SENSOR_TYPES
+            if description.significant_change is not None
+        }
+        schema[
+            vol.Required(
+                CONF_SIGNIFICANT_MAX_AGE,
+                default=self.config_entry.options.get(
+                    CONF_SIGNIFICANT_MAX_AGE, DEFAULT_SIGNIFICANT_MAX_AGE
+                ),
+            )
+        ] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                step=1,
+                mode=selector.NumberSelectorMode.BOX,
+                unit_of_measurement="min",
+            )
+        )
+
+        return self.async_show_form(
+            step_id="thresholds", data_schema=vol.Schema(schema), last_step=False
+        )
+
+    async def async_step_charging(self, user_input=None) -> FlowResult():
+        """Set the tariffs and battery capacity of charging sessions."""
+        errors = {}
+        if user_input is not None:
+            try:
+                parse_tariffs(user_input.get(CONF_TARIFFS, ""))
+            except ValueError:
+                errors[CONF_TARIFFS] = "invalid_tariffs"
+            else:
+                self._data.update(user_input)
+                return await self.async_step_init()
+
+        data_schema = self.add_suggested_values_to_schema(
+            vol.Schema(
+                {
+                    vol.Optional(CONF_TARIFFS, default=""): selector.TextSelector(
+                        selector.TextSelectorConfig(multiline=True)
+                    ),
+                    vol.Optional(
+                        CONF_BATTERY_CAPACITY, default=DEFAULT_BATTERY_CAPACITY
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            step="any",
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="kWh",
+                        )
+                    ),
                 }
             ),
-            self.config_entry.options,
+            user_input or self.config_entry.options,
         )
+        return self.async_show_form(
+            step_id="charging", data_schema=data_schema, errors=errors, last_step=False
+        )
+
+    async def async_step_vins(self, user_input=None) -> FlowResult():
+        """Select the vehicles managed by this entry."""
+        if user_input is not None:
+            self._data.update(user_input)
+            return await self.async_step_init()
+
+        if coordinator := getattr(self.config_entry, "runtime_data", None):
+            vehicles = {
+                vehicle.vin: f"{vehicle.infos.media.short_name} ({vehicle.vin})"
+                for vehicle in coordinator.api.vehicles
+            }
+        else:
+            dev_reg = dr.async_get(self.hass)
+            vehicles = {
+                identifier[1]: f"{device.name} ({identifier[1]})"
+                for device in dr.async_entries_for_config_entry(
+                    dev_reg, self.config_entry.entry_id
+                )
+                for identifier in device.identifiers
+                if identifier[0] == DOMAIN and device.entry_type is None
+            }
 
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_VINS,
+                    default=self.config_entry.options.get(CONF_VINS, []),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        mode=selector.SelectSelectorMode.LIST,
+                        multiple=True,
+                        options=[
+                            selector.SelectOptionDict(value=vin, label=label)
+                            for vin, label in vehicles.items()
+                        ],
+                    )
+                )
+            }
+        )
         return self.async_show_form(
-            step_id="other", data_schema=data_schema, last_step=False
+            step_id="vins", data_schema=data_schema, last_step=False
         )
 
     async def async_step_apilevel(self, user_input=None) -> FlowResult():
         """Handle a flow initialized by the user."""
+        errors = {}
         if user_input is not None:
-            self._data.update({self._sel: user_input})
-            return await self.async_step_init()
+            try:
+                parse_windows(user_input.get(CONF_QUIET_HOURS, ""))
+            except ValueError:
+                errors[CONF_QUIET_HOURS] = "invalid_quiet_hours"
+            else:
+                self._data.update({self._sel: user_input})
+                return await self.async_step_init()
 
         api_level = self.config_entry.options.get(self._sel, {})
 
@@ -239,13 +491,19 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             ],
                         )
                     ),
+                    vol.Optional(
+                        CONF_QUIET_HOURS,
+                        description={
+                            "suggested_value": api_level.get(CONF_QUIET_HOURS)
+                        },
+                    ): selector.TextSelector(),
                 }
             ),
-            self.config_entry.options,
+            api_level,
         )
 
         return self.async_show_form(
-            step_id="apilevel", data_schema=data_schema, last_step=False
+            step_id="apilevel", data_schema=data_schema, errors=errors, last_step=False
         )
 
     async def async_step_save(self, user_input=None) -> FlowResult():
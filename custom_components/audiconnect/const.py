@@ -73,9 +73,73 @@ COUNTRY_CODE = {
 }
 
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_HTTP_TRACING = "http_tracing"
+CONF_RECORD_CASSETTES = "record_cassettes"
+CONF_THRESHOLDS = "thresholds"
+CONF_TRACKER_DISTANCE = "tracker_distance"
+CONF_MOVING_SCAN_INTERVAL = "moving_scan_interval"
+CONF_HISTORY_SIZE = "history_size"
+CONF_TARIFFS = "tariffs"
+CONF_PUSH = "push"
+CONF_PUSH_SCAN_INTERVAL = "push_scan_interval"
+CONF_WEBHOOK_ID = "webhook_id"
+CONF_QUIET_HOURS = "quiet_hours"
+CONF_QUIET_SCAN_INTERVAL = "quiet_scan_interval"
+CONF_DOMAIN_SCHEDULING = "domain_scheduling"
+CONF_VINS = "vins"
+CONF_BATTERY_CAPACITY = "battery_capacity"
+CONF_SIGNIFICANT_MAX_AGE = "significant_max_age"
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_SIGNIFICANT_MAX_AGE = 120
+DEFAULT_TRACKER_DISTANCE = 50
+DEFAULT_MOVING_SCAN_INTERVAL = 60
+DEFAULT_HISTORY_SIZE = 2000
+DEFAULT_BATTERY_CAPACITY = 0
+DEFAULT_PUSH_SCAN_INTERVAL = 240
+SIGNAL_POSITION_UPDATED = f"{DOMAIN}_position_updated_{{}}"
 MANUFACTURER = "Audi"
 URL_WEBSITE = "https://my.audi.com"
 MENU_VEHICLES = "vehicles"
 MENU_OTHER = "other"
+MENU_THRESHOLDS = "thresholds"
+MENU_CHARGING = "charging"
+MENU_VINS = "vins"
 MENU_SAVE = "save"
+
+TO_REDACT = {
+    "address",
+    "api_key",
+    "city",
+    "country",
+    "csid",
+    "deviceId",
+    "email",
+    "encryption_password",
+    "encryption_salt",
+    "host",
+    "imei",
+    "ip4_addr",
+    "ip6_addr",
+    "lat",
+    "latitude",
+    "lon",
+    "longitude",
+    "mappingVin",
+    "password",
+    "phone",
+    "pin",
+    "requestId",
+    "serial",
+    "system_serial",
+    "userId",
+    "username",
+    "vin",
+    "firstName",
+    "lastName",
+    "dateOfBirth",
+    "nickname",
+    "placeOfBirth",
+    "carnetEnrollmentCountry",
+    "spin",
+    "customTitle",
+}
@@ -2,30 +2,72 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
 import logging
+import sys
+from typing import TYPE_CHECKING, Any
 
 from audiconnectpy import AudiConnect, AudiException
 from audiconnectpy.vehicle import Vehicle
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_PIN, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 
+from .cache import MetadataCache
+from .cassette import CassetteRecorder
+from .charging import ChargingSessions
 from .const import (
     CONF_COUNTRY,
+    CONF_DOMAIN_SCHEDULING,
+    CONF_HISTORY_SIZE,
+    CONF_HTTP_TRACING,
     CONF_MODEL,
+    CONF_MOVING_SCAN_INTERVAL,
+    CONF_PUSH,
+    CONF_PUSH_SCAN_INTERVAL,
+    CONF_RECORD_CASSETTES,
     CONF_SCAN_INTERVAL,
+    CONF_VINS,
+    DEFAULT_HISTORY_SIZE,
     DEFAULT_MODEL,
+    DEFAULT_MOVING_SCAN_INTERVAL,
+    DEFAULT_PUSH_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MANUFACTURER,
+    SIGNAL_POSITION_UPDATED,
+    URL_WEBSITE,
 )
+from .helpers import apply_status, vehicle_fingerprint
+from .history import PositionHistory
+from .registry import async_get_vehicle_registry
+from .responses import ResponseCache
+from .scheduler import POSITION_JOB, DomainScheduler, PollScheduler
+from .statistics import LongTermStatistics
+from .telemetry import PollTelemetry
+from .tracing import RequestTracer
+
+if TYPE_CHECKING:
+    from cProfile import Profile
 
 _LOGGER = logging.getLogger(__name__)
 
+COMPLETION_POLL_DELAY = timedelta(minutes=2)
+
 
 class AudiDataUpdateCoordinator(DataUpdateCoordinator):
     """Define an object to fetch data."""
@@ -36,8 +78,30 @@ class AudiDataUpdateCoordinator(DataUpdateCoordinator):
             "imperial" if hass.config.units is US_CUSTOMARY_SYSTEM else "metric"
         )
         self.options = entry.options
+        self.telemetry = PollTelemetry()
+        self.responses = ResponseCache()
+        trace_configs = [
+            self.telemetry.create_trace_config(),
+            self.responses.create_trace_config(),
+        ]
+        self.tracer: RequestTracer | None = None
+        if entry.options.get(CONF_HTTP_TRACING):
+            self.tracer = RequestTracer()
+            trace_configs.append(self.tracer.create_trace_config())
+        self.cassette: CassetteRecorder | None = None
+        if entry.options.get(CONF_RECORD_CASSETTES):
+            self.cassette = CassetteRecorder(
+                hass,
+                entry.data.get(CONF_MODEL, DEFAULT_MODEL),
+                entry.data[CONF_USERNAME],
+            )
+            trace_configs.append(self.cassette.create_trace_config())
+        # Closed on unload, instead of when Home Assistant stops.
+        self.session = async_create_clientsession(
+            hass, auto_cleanup=False, trace_configs=trace_configs
+        )
         self.api = AudiConnect(
-            async_create_clientsession(hass),
+            self.session,
             entry.data[CONF_USERNAME],
             entry.data[CONF_PASSWORD],
             entry.data[CONF_COUNTRY],
@@ -50,31 +114,493 @@ class AudiDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(
-                minutes=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                minutes=(
+                    entry.options.get(
+                        CONF_PUSH_SCAN_INTERVAL, DEFAULT_PUSH_SCAN_INTERVAL
+                    )
+                    if entry.options.get(CONF_PUSH)
+                    else entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                )
             ),
         )
+        self.config_entry = entry
+        self.statistics = LongTermStatistics(hass, entry)
+        self.metadata = MetadataCache(hass, entry)
+        self.charging = ChargingSessions(hass, entry)
+        self.scheduler = PollScheduler(entry.options)
+        self._managed_vins: set[str] | None = (
+            set(vins) if (vins := entry.options.get(CONF_VINS)) else None
+        )
+        self.domains: DomainScheduler | None = None
+        if entry.options.get(CONF_DOMAIN_SCHEDULING):
+            self.domains = DomainScheduler(self.update_interval)
+        self.positions = PositionHistory(
+            hass,
+            entry,
+            int(entry.options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)),
+        )
+        self._profile: tuple[Profile, asyncio.Future[Profile]] | None = None
+        self._profiling = False
+        self._fingerprints: dict[str, int] = {}
+        self.changed_vins: set[str] = set()
+        self.unchanged_vins: set[str] = set()
+        self._vins: set[str] = set()
+        self._vehicle_listeners: list[Callable[[list[Vehicle]], None]] = []
+        self._device_infos: dict[str, tuple[tuple[Any, ...], DeviceInfo]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._shut_down = False
+        self._loaded = False
+        self._unsub_position_poll: CALLBACK_TYPE | None = None
+        self._unsub_completion_poll: CALLBACK_TYPE | None = None
+        self._completion_poll_at: datetime | None = None
+
+    @property
+    def vehicles(self) -> list[Vehicle]:
+        """Return the vehicles managed by this entry."""
+        return [
+            vehicle for vehicle in self.api.vehicles if self.is_managed(vehicle.vin)
+        ]
+
+    def is_managed(self, vin: str) -> bool:
+        """Return True if a vehicle is managed by this entry."""
+        return self._managed_vins is None or vin in self._managed_vins
+
+    async def _async_setup(self) -> None:
+        """Load persisted data."""
+        await self.statistics.async_load()
+        await self.metadata.async_load()
+        await self.charging.async_load()
+        await self.positions.async_load()
+        self._loaded = True
 
     async def _async_update_data(self) -> dict:
         """Update data."""
+        self._track_task()
+        if self._profile and not self._profiling:
+            self._profile[0].enable()
+            self._profiling = True
+
+        now = dt_util.utcnow()
+        if self.vehicles and not any(
+            self.scheduler.due(vehicle.vin, now) for vehicle in self.vehicles
+        ):
+            _LOGGER.debug("All vehicles are in quiet hours, poll skipped")
+            return self.vehicles
+
+        if self.cassette:
+            self.cassette.start()
+
+        changed = True
+        try:
+            with self.telemetry.cycle():
+                vehicles = await self._async_poll()
+            changed = bool(self.changed_vins)
+            return vehicles
+        except UpdateFailed:
+            # Entities must be written again once the account is back.
+            self.responses.invalidate()
+            raise
+        finally:
+            # Only cycles which failed or changed a vehicle are worth a cassette.
+            if self.cassette and changed:
+                await self.cassette.async_save(
+                    [vehicle.vin for vehicle in self.api.vehicles]
+                )
+            elif self.cassette:
+                self.cassette.discard()
+
+    async def _async_poll(self) -> list[Vehicle]:
+        """Log in and update vehicles."""
         try:
-            await self.api.async_login()
+            with self.telemetry.measure_login():
+                await self.api.async_login()
         except AudiException as error:
             raise UpdateFailed(error) from error
 
         if self.api.is_connected:
+            now = dt_util.utcnow()
+            self.responses.start_cycle()
             try:
                 for vehicle in self.api.vehicles:
+                    if not self.is_managed(vehicle.vin):
+                        self.telemetry.exclude_vehicle(vehicle.vin)
+                        continue
+                    if not self.scheduler.due(vehicle.vin, now):
+                        continue
                     self._set_api_level(vehicle)
-                    await vehicle.async_update()
+                    with self.telemetry.measure_vehicle(vehicle.vin):
+                        await self._async_update_vehicle(vehicle, now)
+                    self.scheduler.polled(vehicle.vin, now)
             except AudiException as error:
                 raise UpdateFailed(error) from error
             else:
-                return self.api.vehicles
+                await self._async_update_changed_vins()
+                with self.telemetry.measure_blocking("samples"):
+                    self.statistics.async_add_samples(self.vehicles)
+                    self.charging.async_add_samples(self.vehicles)
+                    self.positions.async_add_positions(self.vehicles)
+                self._async_schedule_position_poll()
+                self._async_schedule_completion_poll()
+                if self.domains:
+                    self.update_interval = self.domains.next_interval(
+                        self.vehicles
+                    )
+                return self.vehicles
         else:
             raise UpdateFailed("Unable to connect")
 
+    async def _async_update_vehicle(self, vehicle: Vehicle, now: datetime) -> None:
+        """Update a vehicle, only the status domains due if scheduled per domain."""
+        if self.domains is None or self.domains.needs_full_update(vehicle.vin):
+            await vehicle.async_update()
+            if self.domains:
+                self.domains.polled(
+                    vehicle.vin, self.domains.due_jobs(vehicle, now), now
+                )
+            return
+
+        jobs = self.domains.due_jobs(vehicle, now)
+        if status_jobs := [job for job in jobs if job != POSITION_JOB]:
+            try:
+                status = await vehicle.async_get_selectivestatus(status_jobs)
+            except TypeError:
+                status = None
+            if not isinstance(status, dict):
+                # Older clients neither take jobs nor return the raw payload.
+                _LOGGER.warning(
+                    "Status domains cannot be requested separately, "
+                    "all domains are updated together"
+                )
+                self.update_interval = self.domains.interval
+                self.domains = None
+                await vehicle.async_update()
+                return
+            apply_status(vehicle, status)
+        if POSITION_JOB in jobs:
+            await vehicle.async_get_position()
+        self.domains.polled(vehicle.vin, jobs, now)
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled work, write persisted data and close the session."""
+        if self._shut_down:
+            return
+        self._shut_down = True
+        await super().async_shutdown()
+        self._async_stop_position_poll()
+        self._async_cancel_completion_poll()
+        self._vehicle_listeners.clear()
+        # Polls in progress would otherwise run on with a closed session.
+        current = asyncio.current_task()
+        if tasks := [task for task in self._tasks if task is not current]:
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
+        # Data that failed to load must not overwrite the stores.
+        if self._loaded:
+            await asyncio.gather(
+                self.statistics.async_save(),
+                self.metadata.async_save(),
+                self.charging.async_save(),
+                self.positions.async_save(),
+            )
+        await self.session.close()
+
+    def _track_task(self) -> None:
+        """Remember the task of a poll so that it is cancelled on unload."""
+        if (task := asyncio.current_task()) is not None and task not in self._tasks:
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @callback
+    def async_add_vehicle_listener(
+        self, add_vehicles: Callable[[list[Vehicle]], None]
+    ) -> CALLBACK_TYPE:
+        """Add entities of the current vehicles now and of new vehicles later."""
+        add_vehicles(self.data)
+        self._vehicle_listeners.append(add_vehicles)
+        return lambda: self._vehicle_listeners.remove(add_vehicles)
+
+    @callback
+    def _async_update_vehicle_set(self) -> None:
+        """Add entities of new vehicles and remove the devices of departed ones."""
+        async_get_vehicle_registry(self.hass).async_update(self)
+        vins = {vehicle.vin for vehicle in self.data}
+        if new := [vehicle for vehicle in self.data if vehicle.vin not in self._vins]:
+            _LOGGER.debug("%s new vehicles found", len(new))
+            for add_vehicles in self._vehicle_listeners:
+                add_vehicles(new)
+        if departed := self._vins - vins:
+            _LOGGER.debug("%s vehicles left the account", len(departed))
+            self.async_remove_devices(departed)
+        self._vins = vins
+        for vehicle in self.data:
+            self._async_refresh_device_info(vehicle)
+
+    @callback
+    def async_device_info(self, vehicle: Vehicle) -> DeviceInfo:
+        """Return the device info of a vehicle, shared by its entities.
+
+        The same dict is handed to every entity of the vehicle, so it must be
+        treated as read only. It is rebuilt when the vehicle metadata change.
+        """
+        infos = (
+            vehicle.infos.core.model_year,
+            vehicle.infos.media.long_name,
+            vehicle.infos.media.short_name,
+        )
+        cached = self._device_infos.get(vehicle.vin)
+        if cached is None or cached[0] != infos:
+            cached = self._device_infos[vehicle.vin] = (
+                infos,
+                DeviceInfo(
+                    configuration_url=URL_WEBSITE,
+                    hw_version=_intern(infos[0]),
+                    identifiers={(DOMAIN, vehicle.vin)},
+                    manufacturer=MANUFACTURER,
+                    model=_intern(infos[1]),
+                    name=infos[2],
+                ),
+            )
+        return cached[1]
+
+    @callback
+    def _async_refresh_device_info(self, vehicle: Vehicle) -> None:
+        """Update the device of a vehicle whose metadata changed."""
+        previous = self._device_infos.get(vehicle.vin)
+        device_info = self.async_device_info(vehicle)
+        if previous is None or previous[1] is device_info:
+            return
+        dev_reg = dr.async_get(self.hass)
+        if device := dev_reg.async_get_device(identifiers={(DOMAIN, vehicle.vin)}):
+            dev_reg.async_update_device(
+                device.id,
+                hw_version=device_info["hw_version"],
+                model=device_info["model"],
+                name=device_info["name"],
+            )
+
+    @callback
+    def async_invalidate_metadata(self, vin: str | None = None) -> None:
+        """Forget cached metadata and device info of a vehicle, or all."""
+        self.metadata.async_invalidate(vin)
+        for vehicle in self.vehicles:
+            if vin in (None, vehicle.vin):
+                self._device_infos.pop(vehicle.vin, None)
+
+    @callback
+    def async_remove_devices(self, vins: set[str]) -> None:
+        """Remove the devices and entities of vehicles."""
+        for vin in vins:
+            self._device_infos.pop(vin, None)
+        dev_reg = dr.async_get(self.hass)
+        for device in dr.async_entries_for_config_entry(
+            dev_reg, self.config_entry.entry_id
+        ):
+            if device.entry_type is None and (
+                dict(device.identifiers).get(DOMAIN) in vins
+            ):
+                dev_reg.async_update_device(
+                    device.id, remove_config_entry_id=self.config_entry.entry_id
+                )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners."""
+        if self.data is not None:
+            self._async_update_vehicle_set()
+        with self.telemetry.measure_fanout():
+            super().async_update_listeners()
+
+        if self._profiling:
+            profiler, future = self._profile
+            self._profile = None
+            self._profiling = False
+            profiler.disable()
+            if not future.done():
+                future.set_result(profiler)
+
+    async def async_profile_refresh(self, force: bool) -> Profile:
+        """Profile a forced refresh or the next scheduled poll cycle."""
+        from cProfile import Profile  # pylint: disable=import-outside-toplevel
+
+        profiler = Profile()
+        if force:
+            profiler.enable()
+            try:
+                await self.async_refresh()
+            finally:
+                profiler.disable()
+            return profiler
+
+        future: asyncio.Future[Profile] = self.hass.loop.create_future()
+        self._profile = (profiler, future)
+        try:
+            async with asyncio.timeout(self.update_interval.total_seconds() + 60):
+                return await future
+        finally:
+            if self._profile and self._profile[1] is future:
+                self._profile = None
+                if self._profiling:
+                    self._profiling = False
+                    profiler.disable()
+
+    @callback
+    def _async_schedule_position_poll(self) -> None:
+        """Poll positions more often while a vehicle is moving."""
+        moving = any(vehicle.is_moving for vehicle in self.vehicles)
+        if moving and self._unsub_position_poll is None:
+            self._unsub_position_poll = async_track_time_interval(
+                self.hass,
+                self._async_poll_positions,
+                timedelta(
+                    seconds=self.options.get(
+                        CONF_MOVING_SCAN_INTERVAL, DEFAULT_MOVING_SCAN_INTERVAL
+                    )
+                ),
+                name=f"{DOMAIN} position poll",
+            )
+        elif not moving:
+            self._async_stop_position_poll()
+
+    @callback
+    def _async_stop_position_poll(self) -> None:
+        """Stop the position-only poll."""
+        if self._unsub_position_poll:
+            self._unsub_position_poll()
+            self._unsub_position_poll = None
+
+    async def _async_poll_positions(self, _: datetime) -> None:
+        """Update the position of moving vehicles only."""
+        self._track_task()
+        for vehicle in self.vehicles:
+            if not vehicle.is_moving:
+                continue
+            try:
+                await vehicle.async_get_position()
+            except AudiException as error:
+                _LOGGER.debug("Unable to update position: %s", error)
+            else:
+                self.unchanged_vins.discard(vehicle.vin)
+                self.responses.invalidate(vehicle.vin)
+                self.positions.async_add_positions([vehicle])
+                async_dispatcher_send(
+                    self.hass, SIGNAL_POSITION_UPDATED.format(vehicle.vin)
+                )
+
+    @callback
+    def _async_schedule_completion_poll(self) -> None:
+        """Poll once shortly after the predicted end of charge."""
+        if (eta := self.charging.next_completion()) is None:
+            self._async_cancel_completion_poll()
+            return
+        when = eta + COMPLETION_POLL_DELAY
+        # Each predicted end of charge is polled once.
+        if when == self._completion_poll_at:
+            return
+        self._async_cancel_completion_poll()
+        # A stale sample or an early estimate may predict an end already past.
+        now = dt_util.utcnow()
+        if when <= now or when - now >= self.update_interval:
+            return
+        _LOGGER.debug("Charge completion poll scheduled at %s", when)
+        self._completion_poll_at = when
+        self._unsub_completion_poll = async_track_point_in_utc_time(
+            self.hass, self._async_completion_poll, when
+        )
+
+    @callback
+    def _async_cancel_completion_poll(self) -> None:
+        """Cancel the charge completion poll."""
+        self._completion_poll_at = None
+        if self._unsub_completion_poll:
+            self._unsub_completion_poll()
+            self._unsub_completion_poll = None
+
+    async def _async_completion_poll(self, _: datetime) -> None:
+        """Refresh when the charge is expected to be complete."""
+        self._track_task()
+        self._unsub_completion_poll = None
+        await self.async_request_refresh()
+
+    @callback
+    def async_apply_push(self, vin: str, payload: dict[str, Any]) -> bool:
+        """Apply a pushed status to a vehicle and update its entities."""
+        for vehicle in self.vehicles:
+            if vehicle.vin == vin:
+                break
+        else:
+            return False
+
+        applied = apply_status(vehicle, payload)
+        _LOGGER.debug("Push update applied %s fields", applied)
+        if not applied:
+            return True
+        self.telemetry.vehicle_updated[vin] = dt_util.utcnow()
+        self.changed_vins = {vin}
+        self.unchanged_vins.discard(vin)
+        self.responses.invalidate(vin)
+        self._fingerprints.pop(vin, None)
+        self.charging.async_add_samples([vehicle])
+        self.positions.async_add_positions([vehicle])
+        self.async_set_updated_data(self.vehicles)
+        if self.scheduler.is_quiet(vin, dt_util.utcnow()):
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_wake(vin), f"{DOMAIN} wake {vin}"
+            )
+        return True
+
+    async def async_wake(self, vin: str | None = None) -> None:
+        """Resume polling of a vehicle after a command or a push and refresh."""
+        self.scheduler.wake(vin)
+        await self.async_request_refresh()
+
+    async def _async_update_changed_vins(self) -> None:
+        """Find vehicles whose data changed apart from poll timestamps."""
+        # Vehicles which got the same responses as the last poll are unchanged.
+        self.unchanged_vins = (
+            self.responses.unchanged_vins() & self._fingerprints.keys()
+        )
+        # Serializing is the costly part, so it runs in the executor too. Only
+        # pushes and position polls mutate vehicles meanwhile, and they notify
+        # the entities of the vehicle themselves.
+        fingerprints = await self.hass.async_add_executor_job(
+            _vehicle_fingerprints,
+            [
+                vehicle
+                for vehicle in self.vehicles
+                if vehicle.vin not in self.unchanged_vins
+            ],
+        )
+        self.changed_vins = set()
+        for vin, fingerprint in fingerprints.items():
+            if fingerprint is None:
+                self._fingerprints.pop(vin, None)
+                self.changed_vins.add(vin)
+            elif self._fingerprints.get(vin) != fingerprint:
+                self._fingerprints[vin] = fingerprint
+                self.changed_vins.add(vin)
+
     def _set_api_level(self, ojb: Vehicle) -> None:
         """Set API Level."""
         if api_levels := self.options.get(ojb.vin):
             for name, level in api_levels.items():
+                if not name.startswith("api_level_"):
+                    continue
                 ojb.set_api_level(name.replace("api_level_", ""), int(level))
+
+
+def _vehicle_fingerprints(vehicles: list[Vehicle]) -> dict[str, int | None]:
+    """Return the fingerprint of each vehicle, None if it changed meanwhile."""
+    fingerprints: dict[str, int | None] = {}
+    for vehicle in vehicles:
+        try:
+            fingerprints[vehicle.vin] = vehicle_fingerprint(vehicle.to_dict())
+        except RuntimeError:
+            # An attribute was added on the event loop during serialization.
+            fingerprints[vehicle.vin] = None
+    return fingerprints
+
+
+def _intern(value: Any) -> Any:
+    """Return strings repeated across vehicles of the same model only once."""
+    return sys.intern(value) if isinstance(value, str) else value
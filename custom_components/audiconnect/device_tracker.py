@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
 import logging
 
+from audiconnectpy.vehicle import Vehicle
+
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util.location import distance
 
 from . import AudiConfigEntry
+from .const import (
+    CONF_TRACKER_DISTANCE,
+    DEFAULT_TRACKER_DISTANCE,
+    SIGNAL_POSITION_UPDATED,
+)
 from .entity import AudiEntity
 from .helpers import AudiTrackerDescription
 
@@ -25,17 +35,35 @@ async def async_setup_entry(
 ) -> None:
     """Set up device tracker."""
     coordinator = entry.runtime_data
-    entities = [
-        AudiDeviceTracker(coordinator, vehicle, description)
-        for description in SENSOR_TYPES
-        for vehicle in coordinator.data
-    ]
-    async_add_entities(entities)
+
+    @callback
+    def async_add_vehicles(vehicles: list[Vehicle]) -> None:
+        """Add entities of vehicles."""
+        async_add_entities(
+            AudiDeviceTracker(coordinator, vehicle, description)
+            for description in SENSOR_TYPES
+            for vehicle in vehicles
+        )
+
+    entry.async_on_unload(coordinator.async_add_vehicle_listener(async_add_vehicles))
 
 
 class AudiDeviceTracker(AudiEntity, TrackerEntity):
     """Represent a tracked device."""
 
+    _unrecorded_attributes = frozenset({"parktime"})
+
+    async def async_added_to_hass(self) -> None:
+        """Listen to position-only polls."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_POSITION_UPDATED.format(self.vehicle.vin),
+                self._handle_coordinator_update,
+            )
+        )
+
     @property
     def latitude(self):
         """Return latitude value of the device."""
@@ -55,3 +83,33 @@ class AudiDeviceTracker(AudiEntity, TrackerEntity):
     def extra_state_attributes(self):
         """Return extra attributes."""
         return {"parktime": self.vehicle.position.last_access}
+
+    @callback
+    def _async_should_write_state(self) -> bool:
+        """Write only if the car moved beyond the distance or the park time changed."""
+        position = self.vehicle.position
+        if (
+            (written := self._last_written) is not None
+            and written[0] == self.available
+            and written[3] == position.last_access
+            and None not in (written[1], written[2])
+            and None not in (position.latitude, position.longitude)
+            and distance(
+                written[1], written[2], position.latitude, position.longitude
+            )
+            < self.coordinator.options.get(
+                CONF_TRACKER_DISTANCE, DEFAULT_TRACKER_DISTANCE
+            )
+        ):
+            return False
+        return super()._async_should_write_state()
+
+    def _state_fingerprint(self) -> Hashable:
+        """Return position and park time without evaluating zones."""
+        position = self.vehicle.position
+        return (
+            self.available,
+            position.latitude,
+            position.longitude,
+            position.last_access,
+        )
@@ -10,44 +10,7 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
 from . import AudiConfigEntry
-
-TO_REDACT = {
-    "address",
-    "api_key",
-    "city",
-    "country",
-    "csid",
-    "deviceId",
-    "email",
-    "encryption_password",
-    "encryption_salt",
-    "host",
-    "imei",
-    "ip4_addr",
-    "ip6_addr",
-    "lat",
-    "latitude",
-    "lon",
-    "longitude",
-    "mappingVin",
-    "password",
-    "phone",
-    "pin",
-    "requestId",
-    "serial",
-    "system_serial",
-    "userId",
-    "username",
-    "vin",
-    "firstName",
-    "lastName",
-    "dateOfBirth",
-    "nickname",
-    "placeOfBirth",
-    "carnetEnrollmentCountry",
-    "spin",
-    "customTitle",
-}
+from .const import TO_REDACT
 
 
 async def async_get_config_entry_diagnostics(
@@ -65,28 +28,59 @@ async def async_get_config_entry_diagnostics(
                 else vars(rsp)
             )
 
+    metadata = coordinator.metadata
     information_vehicles = {
-        "async_get_information_vehicles": await diag(
-            coordinator.api.async_get_information_vehicles
+        "async_get_information_vehicles": await metadata.async_get(
+            "information_vehicles",
+            lambda: diag(coordinator.api.async_get_information_vehicles),
         )
     }
 
-    vehicles = {}
+    functions = {}
     for idx, vehicle in enumerate(coordinator.data):
-        functions = {
-            "async_get_capabilities": await diag(vehicle.async_get_capabilities),
+        functions[idx] = {
+            "async_get_capabilities": await metadata.async_get(
+                "capabilities",
+                lambda vehicle=vehicle: diag(vehicle.async_get_capabilities),
+                vehicle.vin,
+            ),
             "async_get_selectivestatus": await diag(vehicle.async_get_selectivestatus),
         }
-        vehicle_dict = vehicle.to_dict()
-        vehicle_dict.update(**functions)
-        vehicle_dict.pop("location", None)
-        vehicles.update({idx: vehicle_dict})
 
+    # Vehicles are mutated on the event loop, only redaction runs in the executor.
+    information_vehicles, vehicles = await hass.async_add_executor_job(
+        _redact_vehicles,
+        [vehicle.to_dict() for vehicle in coordinator.data],
+        information_vehicles,
+        functions,
+    )
     return {
         "entry": {
             "data": async_redact_data(entry.data, TO_REDACT),
             "options": async_redact_data(entry.options, TO_REDACT),
         },
-        "information_vehicles": async_redact_data(information_vehicles, TO_REDACT),
-        "vehicles": async_redact_data(vehicles, TO_REDACT),
+        "information_vehicles": information_vehicles,
+        "vehicles": vehicles,
+        "telemetry": coordinator.telemetry.as_dict(),
+        "response_cache": coordinator.responses.as_dict(),
+        "charging_sessions": coordinator.charging.as_dict(),
+        "metadata_cache": metadata.as_dict(),
+        "http_tracing": coordinator.tracer.as_dict() if coordinator.tracer else None,
     }
+
+
+def _redact_vehicles(
+    snapshots: list[dict[str, Any]],
+    information_vehicles: dict[str, Any],
+    functions: dict[int, dict[str, Any]],
+) -> tuple[dict[str, Any], dict[int, Any]]:
+    """Redact vehicle snapshots, CPU heavy for large accounts."""
+    vehicles = {}
+    for idx, vehicle_dict in enumerate(snapshots):
+        vehicle_dict.update(**functions[idx])
+        vehicle_dict.pop("location", None)
+        vehicles.update({idx: vehicle_dict})
+    return (
+        async_redact_data(information_vehicles, TO_REDACT),
+        async_redact_data(vehicles, TO_REDACT),
+    )
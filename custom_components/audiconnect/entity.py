@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
 import logging
 from operator import attrgetter
 
@@ -11,15 +12,16 @@ from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, URL_WEBSITE
 from .coordinator import AudiDataUpdateCoordinator
 from .helpers import (
     AudiBinarySensorDescription,
+    AudiChargingSensorDescription,
     AudiLockDescription,
     AudiNumberDescription,
     AudiSelectDescription,
     AudiSensorDescription,
     AudiSwitchDescription,
+    AudiTelemetrySensorDescription,
     AudiTrackerDescription,
 )
 
@@ -30,17 +32,21 @@ class AudiEntity(CoordinatorEntity[AudiDataUpdateCoordinator], Entity):
     """Base class for all entities."""
 
     _attr_has_entity_name = True
+    _last_written: Hashable | None = None
+    _skip_unchanged = True
 
     def __init__(
         self,
         coordinator: AudiDataUpdateCoordinator,
         vehicle: Vehicle,
         description: AudiBinarySensorDescription
+        | AudiChargingSensorDescription
         | AudiLockDescription
         | AudiNumberDescription
         | AudiSelectDescription
         | AudiSwitchDescription
         | AudiSensorDescription
+        | AudiTelemetrySensorDescription
         | AudiTrackerDescription,
     ) -> None:
         """Initialize the entity."""
@@ -49,23 +55,45 @@ class AudiEntity(CoordinatorEntity[AudiDataUpdateCoordinator], Entity):
         self.entity_description = description
 
         self._attr_unique_id = f"{vehicle.vin}_{description.key}"
-        self._attr_device_info = {
-            "configuration_url": URL_WEBSITE,
-            "hw_version": vehicle.infos.core.model_year,
-            "identifiers": {(DOMAIN, vehicle.vin)},
-            "manufacturer": MANUFACTURER,
-            "model": vehicle.infos.media.long_name,
-            "name": vehicle.infos.media.short_name,
-        }
+        self._attr_device_info = coordinator.async_device_info(vehicle)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        for vehicle in self.coordinator.data:
-            if vehicle.vin == self.vehicle.vin:
-                break
+        if (
+            self._skip_unchanged
+            and self.coordinator.last_update_success
+            and self.vehicle.vin in self.coordinator.unchanged_vins
+        ):
+            return
+        vehicle = next(
+            (
+                vehicle
+                for vehicle in self.coordinator.data
+                if vehicle.vin == self.vehicle.vin
+            ),
+            None,
+        )
+        if vehicle is None:
+            # The vehicle left the account, its entities are being removed.
+            return
         self.vehicle = vehicle
-        self.async_write_ha_state()
+        if self._async_should_write_state():
+            self.async_write_ha_state()
+
+    @callback
+    def _async_should_write_state(self) -> bool:
+        """Return True if state or attributes changed since the last write."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_written:
+            return False
+        self._last_written = fingerprint
+        return True
+
+    def _state_fingerprint(self) -> Hashable:
+        """Return what is written to the state machine."""
+        attributes = self.extra_state_attributes or {}
+        return (self.available, self.state, tuple(sorted(attributes.items())))
 
     def getattr(self, value: str) -> str | float | int | bool | None:
         """Get recursive attribute."""
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
+import re
+from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntityDescription
 from homeassistant.components.lock import LockEntityDescription
@@ -11,7 +14,67 @@ from homeassistant.components.number import NumberEntityDescription
 from homeassistant.components.select import SelectEntityDescription
 from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.components.switch import SwitchEntityDescription
+from homeassistant.helpers.json import json_bytes_sorted
 from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
+
+VOLATILE_KEYS = {"last_access", "last_update"}
+_CAMEL_1 = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_2 = re.compile(r"([a-z0-9])([A-Z])")
+_LEAF_TYPES = (str, int, float, bool, list, dict, datetime, type(None))
+_PROTECTED = frozenset({"api", "vin"})
+
+
+def _strip_volatile(value: Any) -> Any:
+    """Remove timestamps which move with each poll."""
+    if isinstance(value, dict):
+        return {
+            key: _strip_volatile(item)
+            for key, item in value.items()
+            if key not in VOLATILE_KEYS and "timestamp" not in key.lower()
+        }
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+def vehicle_fingerprint(data: dict[str, Any]) -> int:
+    """Return a hash of vehicle data ignoring poll timestamps."""
+    return hash(json_bytes_sorted(_strip_volatile(data)))
+
+
+def snake_case(name: str) -> str:
+    """Return snake case of a camel case key."""
+    return _CAMEL_2.sub(r"\1_\2", _CAMEL_1.sub(r"\1_\2", name)).lower()
+
+
+def apply_status(target: Any, payload: dict[str, Any]) -> int:
+    """Merge a selective status payload into vehicle attributes.
+
+    Only data attributes that already exist are updated, never methods,
+    private attributes or the vin and api of the vehicle. Value nodes are
+    unwrapped and timestamps are parsed. Return the number of fields applied.
+    """
+    applied = 0
+    for key, value in payload.items():
+        if isinstance(value, dict) and set(value) == {"value"}:
+            value = value["value"]
+        name = snake_case(key)
+        if name.startswith("_") or name in _PROTECTED or not hasattr(target, name):
+            continue
+        if callable(current := getattr(target, name)):
+            continue
+        if isinstance(value, dict) and not isinstance(current, _LEAF_TYPES):
+            applied += apply_status(current, value)
+            continue
+        if isinstance(current, datetime) and isinstance(value, str):
+            value = dt_util.parse_datetime(value) or value
+        try:
+            setattr(target, name, value)
+        except AttributeError:
+            continue
+        applied += 1
+    return applied
 
 
 @dataclass(frozen=True)
@@ -27,6 +90,9 @@ class AudiSensorDescription(SensorEntityDescription):
 
     value_fn: Callable[..., StateType] | None = None
     value: str | None = None
+    poll_timestamp: bool = False
+    significant_change: float | None = None
+    significant_relative: bool = False
 
 
 @dataclass(frozen=True)
@@ -75,3 +141,18 @@ class AudiTrackerDescription(SensorEntityDescription):
 
     value_fn: Callable[..., StateType] | None = None
     value: str | None = None
+
+
+@dataclass(frozen=True)
+class AudiTelemetrySensorDescription(SensorEntityDescription):
+    """Describes a telemetry sensor."""
+
+    value_fn: Callable[..., StateType] | None = None
+
+
+@dataclass(frozen=True)
+class AudiChargingSensorDescription(SensorEntityDescription):
+    """Describes a charging session sensor."""
+
+    value_fn: Callable[..., StateType] | None = None
+    history: bool = False
@@ -0,0 +1,264 @@
+"""Position history of Audi connect vehicles."""
+
+from __future__ import annotations
+
+import logging
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import escape
+
+from audiconnectpy.vehicle import Vehicle
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SAVE_DELAY = 60
+FILE_MAGIC = b"AUDP"
+FILE_VERSION = 1
+_HEADER = struct.Struct("<4sH")
+_TRACK = struct.Struct("<17sI")
+_FIELDS = 3  # timestamp, latitude, longitude
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _timestamp(value: Any) -> float:
+    """Return the epoch of a position timestamp."""
+    if isinstance(value, str):
+        value = dt_util.parse_datetime(value)
+    if isinstance(value, datetime):
+        return dt_util.as_utc(value).timestamp()
+    return dt_util.utcnow().timestamp()
+
+
+class PositionTrack:
+    """Ring buffer of positions backed by a flat array of doubles."""
+
+    __slots__ = ("_points", "_start", "capacity", "count")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize."""
+        self.capacity = capacity
+        self.count = 0
+        self._start = 0
+        self._points = array("d", bytes(8 * _FIELDS * capacity))
+
+    def append(self, timestamp: float, latitude: float, longitude: float) -> None:
+        """Add a point, overwriting the oldest one when full."""
+        index = (self._start + self.count) % self.capacity
+        self._points[index * _FIELDS : (index + 1) * _FIELDS] = array(
+            "d", (timestamp, latitude, longitude)
+        )
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def last(self) -> tuple[float, float, float] | None:
+        """Return the most recent point."""
+        if not self.count:
+            return None
+        index = ((self._start + self.count - 1) % self.capacity) * _FIELDS
+        return tuple(self._points[index : index + _FIELDS])
+
+    def __iter__(self) -> Iterator[tuple[float, float, float]]:
+        """Iterate points from the oldest."""
+        for offset in range(self.count):
+            index = ((self._start + offset) % self.capacity) * _FIELDS
+            yield tuple(self._points[index : index + _FIELDS])
+
+    def copy(self) -> PositionTrack:
+        """Return a copy safe to read outside the event loop."""
+        track = PositionTrack(0)
+        track.capacity = self.capacity
+        track.count = self.count
+        track._start = self._start
+        track._points = self._points[:]
+        return track
+
+    def between(
+        self, start: datetime | None, end: datetime | None
+    ) -> Iterator[tuple[float, float, float]]:
+        """Iterate the points within a time range."""
+        first = start.timestamp() if start else float("-inf")
+        last = end.timestamp() if end else float("inf")
+        for point in self:
+            if first <= point[0] <= last:
+                yield point
+
+    def to_bytes(self) -> bytes:
+        """Return the points in order, packed as little-endian doubles."""
+        ordered = array("d")
+        for point in self:
+            ordered.extend(point)
+        if _BIG_ENDIAN:
+            ordered.byteswap()
+        return ordered.tobytes()
+
+    @classmethod
+    def from_bytes(cls, capacity: int, data: bytes) -> PositionTrack:
+        """Restore a track, keeping the most recent points that fit."""
+        track = cls(capacity)
+        points = array("d", data)
+        if _BIG_ENDIAN:
+            points.byteswap()
+        for index in range(0, len(points), _FIELDS):
+            track.append(*points[index : index + _FIELDS])
+        return track
+
+
+class PositionHistory:
+    """Keep a bounded history of positions per vehicle, persisted in binary."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, size: int) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.size = size
+        self.tracks: dict[str, PositionTrack] = {}
+        self._path = Path(
+            hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry.entry_id}.positions")
+        )
+        self._unsub_save: CALLBACK_TYPE | None = None
+
+    async def async_load(self) -> None:
+        """Load the persisted tracks."""
+        if self.size:
+            self.tracks = await self.hass.async_add_executor_job(self._read)
+
+    async def async_save(self) -> None:
+        """Write the tracks now."""
+        if self._unsub_save:
+            self._unsub_save()
+            self._unsub_save = None
+        data = {vin: track.to_bytes() for vin, track in self.tracks.items()}
+        await self.hass.async_add_executor_job(self._write, data)
+
+    @callback
+    def async_add_positions(self, vehicles: list[Vehicle]) -> None:
+        """Add the position of each vehicle if it changed."""
+        if not self.size:
+            return
+        added = False
+        for vehicle in vehicles:
+            position = vehicle.position
+            if position.latitude is None or position.longitude is None:
+                continue
+            track = self.tracks.get(vehicle.vin)
+            if track is None:
+                track = self.tracks[vehicle.vin] = PositionTrack(self.size)
+            point = (
+                _timestamp(position.last_access),
+                float(position.latitude),
+                float(position.longitude),
+            )
+            if (last := track.last()) and (
+                last[1:] == point[1:] or last[0] >= point[0]
+            ):
+                continue
+            track.append(*point)
+            added = True
+
+        if added and self._unsub_save is None:
+            self._unsub_save = async_call_later(
+                self.hass, SAVE_DELAY, self._async_scheduled_save
+            )
+
+    async def _async_scheduled_save(self, _: datetime) -> None:
+        """Write the tracks after a delay."""
+        self._unsub_save = None
+        await self.async_save()
+
+    def _read(self) -> dict[str, PositionTrack]:
+        """Read the tracks file."""
+        try:
+            data = self._path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        try:
+            return self._parse(data)
+        except (struct.error, ValueError) as error:
+            _LOGGER.warning(
+                "Ignore corrupt position history %s: %s", self._path, error
+            )
+            return {}
+
+    def _parse(self, data: bytes) -> dict[str, PositionTrack]:
+        """Parse the tracks file, raising ValueError if it is not valid."""
+        magic, version = _HEADER.unpack_from(data)
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            raise ValueError("unsupported format")
+
+        tracks = {}
+        offset = _HEADER.size
+        while offset < len(data):
+            vin, count = _TRACK.unpack_from(data, offset)
+            offset += _TRACK.size
+            length = count * 8 * _FIELDS
+            if offset + length > len(data):
+                raise ValueError("truncated track")
+            tracks[vin.decode().rstrip("\0")] = PositionTrack.from_bytes(
+                self.size, data[offset : offset + length]
+            )
+            offset += length
+        return tracks
+
+    def _write(self, data: dict[str, bytes]) -> None:
+        """Write the tracks file atomically."""
+        chunks = [_HEADER.pack(FILE_MAGIC, FILE_VERSION)]
+        for vin, points in data.items():
+            chunks.append(_TRACK.pack(vin.encode(), len(points) // (8 * _FIELDS)))
+            chunks.append(points)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self._path.with_suffix(".tmp")
+        temp.write_bytes(b"".join(chunks))
+        temp.replace(self._path)
+
+
+def _iso(timestamp: float) -> str:
+    """Return an ISO 8601 UTC time."""
+    return dt_util.utc_from_timestamp(timestamp).isoformat().replace("+00:00", "Z")
+
+
+def iter_gpx(name: str, points: Iterator[tuple[float, float, float]]) -> Iterator[str]:
+    """Yield the chunks of a GPX document."""
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<gpx version="1.1" creator="Audi connect" '
+        'xmlns="http://www.topografix.com/GPX/1/1">\n'
+        f"<trk><name>{escape(name)}</name><trkseg>\n"
+    )
+    for timestamp, latitude, longitude in points:
+        yield (
+            f'<trkpt lat="{latitude:.6f}" lon="{longitude:.6f}">'
+            f"<time>{_iso(timestamp)}</time></trkpt>\n"
+        )
+    yield "</trkseg></trk>\n</gpx>\n"
+
+
+def iter_geojson(
+    name: str, points: Iterator[tuple[float, float, float]]
+) -> Iterator[str]:
+    """Yield the chunks of a GeoJSON feature collection."""
+    yield '{"type":"FeatureCollection","features":['
+    separator = ""
+    for timestamp, latitude, longitude in points:
+        yield separator + json_dumps(
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+                "properties": {"name": name, "time": _iso(timestamp)},
+            }
+        )
+        separator = ","
+    yield "]}"
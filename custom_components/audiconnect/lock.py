@@ -5,10 +5,11 @@ from __future__ import annotations
 import logging
 
 from audiconnectpy import AudiException
+from audiconnectpy.vehicle import Vehicle
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass as dc
 from homeassistant.components.lock import LockEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AudiConfigEntry
@@ -34,12 +35,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up lock."""
     coordinator = entry.runtime_data
-    entities = [
-        AudiLock(coordinator, vehicle, description)
-        for description in SENSOR_TYPES
-        for vehicle in coordinator.data
-    ]
-    async_add_entities(entities)
+
+    @callback
+    def async_add_vehicles(vehicles: list[Vehicle]) -> None:
+        """Add entities of vehicles."""
+        async_add_entities(
+            AudiLock(coordinator, vehicle, description)
+            for description in SENSOR_TYPES
+            for vehicle in vehicles
+        )
+
+    entry.async_on_unload(coordinator.async_add_vehicle_listener(async_add_vehicles))
 
 
 class AudiLock(AudiEntity, LockEntity):
@@ -60,7 +66,7 @@ class AudiLock(AudiEntity, LockEntity):
                 self.vehicle,
                 self.entity_description.turn_mode,
             )(True)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_wake(self.vehicle.vin)
         except AudiException as error:
             _LOGGER.error("Error to turn on : %s", error)
 
@@ -71,6 +77,6 @@ class AudiLock(AudiEntity, LockEntity):
                 self.vehicle,
                 self.entity_description.turn_mode,
             )(False)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_wake(self.vehicle.vin)
         except AudiException as error:
             _LOGGER.error("Error to turn on : %s", error)
@@ -5,9 +5,10 @@ from __future__ import annotations
 import logging
 
 from audiconnectpy import AudiException
+from audiconnectpy.vehicle import Vehicle
 
 from homeassistant.components.number import NumberDeviceClass as dc, NumberEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AudiConfigEntry
@@ -51,12 +52,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up the switch."""
     coordinator = entry.runtime_data
-    entities = [
-        AudiNumber(coordinator, vehicle, description)
-        for description in SENSOR_TYPES
-        for vehicle in coordinator.data
-    ]
-    async_add_entities(entities)
+
+    @callback
+    def async_add_vehicles(vehicles: list[Vehicle]) -> None:
+        """Add entities of vehicles."""
+        async_add_entities(
+            AudiNumber(coordinator, vehicle, description)
+            for description in SENSOR_TYPES
+            for vehicle in vehicles
+        )
+
+    entry.async_on_unload(coordinator.async_add_vehicle_listener(async_add_vehicles))
 
 
 class AudiNumber(AudiEntity, NumberEntity):
@@ -82,6 +88,6 @@ class AudiNumber(AudiEntity, NumberEntity):
                 self.vehicle,
                 self.entity_description.turn_mode,
             )(value)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_wake(self.vehicle.vin)
         except AudiException as error:
             _LOGGER.error("Error to set value: %s", error)
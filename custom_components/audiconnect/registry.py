@@ -0,0 +1,95 @@
+"""Vehicles of all loaded Audi connect accounts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from audiconnectpy.vehicle import Vehicle
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import AudiDataUpdateCoordinator
+
+
+class AudiVehicleRegistry:
+    """Index the vehicles of every loaded entry by VIN and device id."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinators: dict[str, AudiDataUpdateCoordinator] = {}
+        self._vehicles: dict[str, tuple[AudiDataUpdateCoordinator, Vehicle]] = {}
+        self._entry_vins: dict[str, set[str]] = {}
+        self._devices: dict[str, str] = {}
+
+    @callback
+    def async_update(self, coordinator: AudiDataUpdateCoordinator) -> None:
+        """Index the current vehicles of an entry."""
+        entry_id = coordinator.config_entry.entry_id
+        self.coordinators[entry_id] = coordinator
+        vins = set()
+        for vehicle in coordinator.vehicles:
+            vins.add(vehicle.vin)
+            # A vehicle shared by two accounts stays with the first entry.
+            if (item := self._vehicles.get(vehicle.vin)) is None or (
+                item[0] is coordinator
+            ):
+                self._vehicles[vehicle.vin] = (coordinator, vehicle)
+        self._async_forget(coordinator, self._entry_vins.get(entry_id, set()) - vins)
+        self._entry_vins[entry_id] = vins
+
+    @callback
+    def async_remove(self, coordinator: AudiDataUpdateCoordinator) -> None:
+        """Forget the vehicles of an unloaded entry."""
+        entry_id = coordinator.config_entry.entry_id
+        self.coordinators.pop(entry_id, None)
+        self._async_forget(coordinator, self._entry_vins.pop(entry_id, set()))
+        # Hand vehicles shared with the unloaded entry over to another one.
+        for other in list(self.coordinators.values()):
+            self.async_update(other)
+
+    @callback
+    def _async_forget(
+        self, coordinator: AudiDataUpdateCoordinator, vins: set[str]
+    ) -> None:
+        """Forget vehicles of an entry, unless another entry owns them now."""
+        if not vins:
+            return
+        for vin in vins:
+            if (item := self._vehicles.get(vin)) and item[0] is coordinator:
+                del self._vehicles[vin]
+        self._devices = {
+            device_id: vin
+            for device_id, vin in self._devices.items()
+            if vin not in vins
+        }
+
+    @callback
+    def async_resolve(
+        self, target: str
+    ) -> tuple[AudiDataUpdateCoordinator, Vehicle]:
+        """Return the coordinator and the vehicle of a VIN or a device id."""
+        if item := self._vehicles.get(target.upper()):
+            return item
+        device_id = target.lower()
+        if (vin := self._devices.get(device_id)) is None:
+            device = dr.async_get(self.hass).async_get(device_id)
+            if device is None or (vin := dict(device.identifiers).get(DOMAIN)) is None:
+                raise HomeAssistantError("Unknown vehicle")
+            self._devices[device_id] = vin
+        if (item := self._vehicles.get(vin)) is None:
+            self._devices.pop(device_id, None)
+            raise HomeAssistantError("Vehicle not loaded")
+        return item
+
+
+@callback
+def async_get_vehicle_registry(hass: HomeAssistant) -> AudiVehicleRegistry:
+    """Return the vehicle registry shared by the entries."""
+    if (registry := hass.data.get(DOMAIN)) is None:
+        registry = hass.data[DOMAIN] = AudiVehicleRegistry(hass)
+    return registry
@@ -0,0 +1,155 @@
+"""Detection of unchanged Audi connect responses."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceRequestEndParams,
+    TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+)
+from yarl import URL
+
+from .telemetry import endpoint_template
+
+_LOGGER = logging.getLogger(__name__)
+
+_VIN = re.compile(r"(?:^|/)([A-HJ-NPR-Z0-9]{17})(?:/|$)", re.IGNORECASE)
+_VALIDATORS = ("ETag", "Last-Modified")
+
+
+def _vin_of(url: URL) -> str | None:
+    """Return the vin of a vehicle url."""
+    return match.group(1).upper() if (match := _VIN.search(url.path)) else None
+
+
+class ResponseCache:
+    """Hash vehicle responses of a poll and compare them with the previous poll."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._digests: dict[tuple[str, str], bytes] = {}
+        self._pending: list[SimpleNamespace] = []
+        self._recording = False
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.validators: Counter[str] = Counter()
+        self.vehicles_skipped = 0
+
+    def create_trace_config(self) -> TraceConfig:
+        """Return an aiohttp trace config hashing response bodies."""
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._async_on_request_start)
+        trace_config.on_request_end.append(self._async_on_request_end)
+        trace_config.on_response_chunk_received.append(self._async_on_chunk_received)
+        return trace_config
+
+    def start_cycle(self) -> None:
+        """Start hashing the responses of a poll."""
+        self._pending = []
+        self._recording = True
+
+    def unchanged_vins(self) -> set[str]:
+        """Return vehicles whose responses all equal those of the previous poll."""
+        self._recording = False
+        changed: set[str] = set()
+        seen: set[str] = set()
+        for request in self._pending:
+            seen.add(request.vin)
+            digest = request.hasher.digest() if request.status == 200 else None
+            if digest is not None and self._digests.get(request.key) == digest:
+                self.hits[request.endpoint] += 1
+                continue
+            self.misses[request.endpoint] += 1
+            changed.add(request.vin)
+            if digest is None:
+                self._digests.pop(request.key, None)
+            else:
+                self._digests[request.key] = digest
+        self._pending = []
+        unchanged = seen - changed
+        self.vehicles_skipped += len(unchanged)
+        _LOGGER.debug("%s of %s vehicles unchanged", len(unchanged), len(seen))
+        return unchanged
+
+    def invalidate(self, vin: str | None = None) -> None:
+        """Forget the responses of a vehicle, or all of them."""
+        if vin is None:
+            self._digests = {}
+        else:
+            self._digests = {
+                key: digest for key, digest in self._digests.items() if key[0] != vin
+            }
+
+    async def _async_on_request_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        """Start hashing a vehicle response."""
+        context.response_hash = None
+        if (
+            not self._recording
+            or params.method != "GET"
+            or (vin := _vin_of(params.url)) is None
+        ):
+            return
+        context.response_hash = request = SimpleNamespace(
+            key=(vin, str(params.url)),
+            endpoint=f"{params.method} {endpoint_template(params.url)}",
+            vin=vin,
+            status=None,
+            hasher=hashlib.blake2b(digest_size=16),
+        )
+        self._pending.append(request)
+
+    async def _async_on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        """Record the status and the cache validators of a response."""
+        if (request := context.response_hash) is None:
+            return
+        request.status = params.response.status
+        if any(header in params.response.headers for header in _VALIDATORS):
+            self.validators[request.endpoint] += 1
+
+    async def _async_on_chunk_received(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        """Hash a chunk of a response."""
+        if (request := context.response_hash) is not None:
+            request.hasher.update(params.chunk)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return hit rates for diagnostics."""
+        hits = sum(self.hits.values())
+        total = hits + sum(self.misses.values())
+        return {
+            "hits": hits,
+            "misses": total - hits,
+            "hit_rate": round(hits / total, 3) if total else None,
+            "vehicles_skipped": self.vehicles_skipped,
+            "endpoints": {
+                endpoint: {
+                    "hits": self.hits[endpoint],
+                    "misses": self.misses[endpoint],
+                    "validators": self.validators[endpoint],
+                }
+                for endpoint in sorted(self.hits.keys() | self.misses.keys())
+            },
+        }
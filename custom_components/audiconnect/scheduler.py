@@ -0,0 +1,184 @@
+"""Polling schedule of Audi connect vehicles."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from operator import attrgetter
+from typing import Any
+
+from audiconnectpy.vehicle import Vehicle
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_QUIET_HOURS, CONF_QUIET_SCAN_INTERVAL
+
+WAKE_DURATION = timedelta(minutes=30)
+POSITION_JOB = "parkingPosition"
+SELECTIVE_STATUS_JOBS = (
+    "access",
+    "charging",
+    "climatisation",
+    "fuelStatus",
+    "measurements",
+    "oilLevel",
+    "vehicleHealthInspection",
+    "vehicleLights",
+)
+
+
+def _get(vehicle: Vehicle, path: str) -> Any:
+    """Return a vehicle attribute or None."""
+    try:
+        return attrgetter(path)(vehicle)
+    except AttributeError:
+        return None
+
+
+@dataclass(frozen=True)
+class AudiDomainSchedule:
+    """Describes the refresh cadence of a status domain."""
+
+    job: str
+    interval: timedelta | None = None
+    fast_interval: timedelta | None = None
+    fast_fn: Callable[[Vehicle], bool] | None = None
+
+
+DOMAIN_SCHEDULES: tuple[AudiDomainSchedule, ...] = (
+    AudiDomainSchedule(
+        job="access",
+        fast_interval=timedelta(minutes=5),
+        fast_fn=lambda vehicle: (
+            _get(vehicle, "access.access_status.door_lock_status") == "unlocked"
+        ),
+    ),
+    AudiDomainSchedule(
+        job="charging",
+        fast_interval=timedelta(minutes=1),
+        fast_fn=lambda vehicle: (
+            _get(vehicle, "charging.plug_status.plug_connection_state")
+            in ("connected", True)
+        ),
+    ),
+    AudiDomainSchedule(job="oilLevel", interval=timedelta(days=1)),
+    AudiDomainSchedule(job="vehicleHealthInspection", interval=timedelta(days=1)),
+    AudiDomainSchedule(job="vehicleLights", interval=timedelta(hours=6)),
+)
+
+
+def parse_windows(text: str) -> list[tuple[time, time]]:
+    """Parse "HH:MM-HH:MM" windows separated by commas or new lines."""
+    windows = []
+    for window in text.replace(",", "\n").splitlines():
+        if not (window := window.strip()):
+            continue
+        start, end = window.split("-")
+        windows.append(
+            (time.fromisoformat(start.strip()), time.fromisoformat(end.strip()))
+        )
+    return windows
+
+
+def _in_window(moment: time, start: time, end: time) -> bool:
+    """Return True if a time of day is within a window, which may span midnight."""
+    if start <= end:
+        return start <= moment < end
+    return moment >= start or moment < end
+
+
+class PollScheduler:
+    """Decide which vehicles are due, honouring quiet hours and wake-ups."""
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        """Initialize."""
+        self._windows = parse_windows(options.get(CONF_QUIET_HOURS, ""))
+        self._vehicle_windows = {
+            vin: windows
+            for vin, vehicle_options in options.items()
+            if isinstance(vehicle_options, Mapping)
+            and (windows := parse_windows(vehicle_options.get(CONF_QUIET_HOURS, "")))
+        }
+        self._quiet_interval = timedelta(
+            minutes=options.get(CONF_QUIET_SCAN_INTERVAL, 0)
+        )
+        self._polled: dict[str, datetime] = {}
+        self._woken: dict[str | None, datetime] = {}
+
+    def is_quiet(self, vin: str, now: datetime) -> bool:
+        """Return True if a vehicle is within its quiet hours."""
+        windows = self._vehicle_windows.get(vin, self._windows)
+        moment = dt_util.as_local(now).time()
+        return any(_in_window(moment, start, end) for start, end in windows)
+
+    def due(self, vin: str, now: datetime) -> bool:
+        """Return True if a vehicle should be updated by this poll."""
+        if any(
+            (until := self._woken.get(key)) and now < until for key in (vin, None)
+        ):
+            return True
+        if not self.is_quiet(vin, now):
+            return True
+        if not self._quiet_interval:
+            return False
+        last = self._polled.get(vin)
+        return last is None or now - last >= self._quiet_interval
+
+    def polled(self, vin: str, now: datetime) -> None:
+        """Record the update of a vehicle."""
+        self._polled[vin] = now
+
+    def wake(self, vin: str | None = None) -> None:
+        """Resume normal polling of a vehicle, or all of them, for a while."""
+        self._woken[vin] = dt_util.utcnow() + WAKE_DURATION
+
+
+class DomainScheduler:
+    """Track when each status domain of each vehicle is due."""
+
+    def __init__(self, interval: timedelta) -> None:
+        """Initialize."""
+        self.interval = interval
+        self._schedules = {schedule.job: schedule for schedule in DOMAIN_SCHEDULES}
+        self._polled: dict[str, dict[str, datetime]] = {}
+
+    def _interval(self, vehicle: Vehicle, job: str) -> timedelta:
+        """Return the current interval of a domain of a vehicle."""
+        if (schedule := self._schedules.get(job)) is None:
+            return self.interval
+        if schedule.fast_fn and schedule.fast_fn(vehicle):
+            return min(schedule.fast_interval, self.interval)
+        return schedule.interval or self.interval
+
+    def needs_full_update(self, vin: str) -> bool:
+        """Return True until a vehicle has been updated once."""
+        return vin not in self._polled
+
+    def due_jobs(self, vehicle: Vehicle, now: datetime) -> list[str]:
+        """Return the domains of a vehicle to refresh by this poll."""
+        polled = self._polled.get(vehicle.vin, {})
+        # Polls are scheduled at the shortest interval, leave some slack.
+        slack = timedelta(seconds=5)
+        return [
+            job
+            for job in (*SELECTIVE_STATUS_JOBS, POSITION_JOB)
+            if (last := polled.get(job)) is None
+            or now - last + slack >= self._interval(vehicle, job)
+        ]
+
+    def polled(self, vin: str, jobs: Iterable[str], now: datetime) -> None:
+        """Record the refresh of domains of a vehicle."""
+        polled = self._polled.setdefault(vin, {})
+        for job in jobs:
+            polled[job] = now
+
+    def next_interval(self, vehicles: Iterable[Vehicle]) -> timedelta:
+        """Return the interval until the next poll."""
+        return min(
+            (
+                self._interval(vehicle, job)
+                for vehicle in vehicles
+                for job in (*SELECTIVE_STATUS_JOBS, POSITION_JOB)
+            ),
+            default=self.interval,
+        )
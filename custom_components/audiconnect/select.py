@@ -5,9 +5,10 @@ from __future__ import annotations
 import logging
 
 from audiconnectpy import AudiException
+from audiconnectpy.vehicle import Vehicle
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AudiConfigEntry
@@ -32,12 +33,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up the switch."""
     coordinator = entry.runtime_data
-    entities = [
-        AudiSelect(coordinator, vehicle, description)
-        for description in SENSOR_TYPES
-        for vehicle in coordinator.data
-    ]
-    async_add_entities(entities)
+
+    @callback
+    def async_add_vehicles(vehicles: list[Vehicle]) -> None:
+        """Add entities of vehicles."""
+        async_add_entities(
+            AudiSelect(coordinator, vehicle, description)
+            for description in SENSOR_TYPES
+            for vehicle in vehicles
+        )
+
+    entry.async_on_unload(coordinator.async_add_vehicle_listener(async_add_vehicles))
 
 
 class AudiSelect(AudiEntity, SelectEntity):
@@ -58,6 +64,6 @@ class AudiSelect(AudiEntity, SelectEntity):
                 self.vehicle,
                 self.entity_description.turn_mode,
             )(True, option)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_wake(self.vehicle.vin)
         except AudiException as error:
             _LOGGER.error("Error to select on : %s", error)
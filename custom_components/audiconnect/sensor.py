@@ -3,15 +3,37 @@
 from __future__ import annotations
 
 import logging
+import time
 
-from homeassistant.components.sensor import SensorDeviceClass as dc, SensorEntity
+from audiconnectpy.vehicle import Vehicle
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass as dc,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import AudiConfigEntry
+from .const import (
+    CONF_SIGNIFICANT_MAX_AGE,
+    CONF_THRESHOLDS,
+    DEFAULT_SIGNIFICANT_MAX_AGE,
+    DOMAIN,
+    MANUFACTURER,
+    URL_WEBSITE,
+)
+from .coordinator import AudiDataUpdateCoordinator
 from .entity import AudiEntity
-from .helpers import AudiSensorDescription
+from .helpers import (
+    AudiChargingSensorDescription,
+    AudiSensorDescription,
+    AudiTelemetrySensorDescription,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +46,7 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
         value="last_access",
         native_unit_of_measurement="datetime",
         device_class=dc.TIMESTAMP,
+        poll_timestamp=True,
         translation_key="last_refresh",
     ),
     AudiSensorDescription(
@@ -33,6 +56,7 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
         value="last_update",
         native_unit_of_measurement="datetime",
         device_class=dc.TIMESTAMP,
+        poll_timestamp=True,
         translation_key="last_update_time",
     ),
     AudiSensorDescription(
@@ -119,6 +143,7 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
         value="measurements.range_status.electric_range",
         translation_key="electric_range",
         entity_registry_enabled_default=False,
+        significant_change=2,
     ),
     AudiSensorDescription(
         key="gasoline_range",
@@ -128,6 +153,7 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
         native_unit_of_measurement="km",
         value="measurements.range_status.gasoline_range",
         translation_key="gasoline_range",
+        significant_change=2,
     ),
     AudiSensorDescription(
         key="tank_level",
@@ -163,6 +189,7 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
         translation_key="battery_temperature_max",
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
+        significant_change=0.5,
     ),
     AudiSensorDescription(
         key="battery_temperature_min",
@@ -174,6 +201,7 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
         translation_key="battery_temperature_min",
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
+        significant_change=0.5,
     ),
     AudiSensorDescription(
         key="battery_level",
@@ -194,6 +222,7 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
         native_unit_of_measurement="km",
         translation_key="cruising_range_electric",
         entity_registry_enabled_default=False,
+        significant_change=2,
     ),
     AudiSensorDescription(
         key="charge_rate",
@@ -203,6 +232,8 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
         native_unit_of_measurement="km/h",
         translation_key="charge_rate_kmph",
         entity_registry_enabled_default=False,
+        significant_change=0.1,
+        significant_relative=True,
     ),
     AudiSensorDescription(
         key="charge_power_kw",
@@ -273,23 +304,220 @@ SENSOR_TYPES: tuple[AudiSensorDescription, ...] = (
     ),
 )
 
+ACCOUNT_SENSOR_TYPES: tuple[AudiTelemetrySensorDescription, ...] = (
+    AudiTelemetrySensorDescription(
+        key="last_poll_duration",
+        name="Last poll duration",
+        icon="mdi:timer-outline",
+        value_fn=lambda telemetry, _: telemetry.last_duration,
+        native_unit_of_measurement="s",
+        device_class=dc.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        translation_key="last_poll_duration",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    AudiTelemetrySensorDescription(
+        key="p95_poll_duration",
+        name="Poll duration (p95)",
+        icon="mdi:timer-outline",
+        value_fn=lambda telemetry, _: telemetry.p95_duration,
+        native_unit_of_measurement="s",
+        device_class=dc.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        translation_key="p95_poll_duration",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    AudiTelemetrySensorDescription(
+        key="consecutive_failures",
+        name="Consecutive failures",
+        icon="mdi:alert-circle-outline",
+        value_fn=lambda telemetry, _: telemetry.consecutive_failures,
+        state_class=SensorStateClass.MEASUREMENT,
+        translation_key="consecutive_failures",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    AudiTelemetrySensorDescription(
+        key="api_calls_last_hour",
+        name="API calls (last hour)",
+        icon="mdi:api",
+        value_fn=lambda telemetry, _: telemetry.requests_last_hour,
+        state_class=SensorStateClass.MEASUREMENT,
+        translation_key="api_calls_last_hour",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+VEHICLE_TELEMETRY_SENSOR_TYPES: tuple[AudiTelemetrySensorDescription, ...] = (
+    AudiTelemetrySensorDescription(
+        key="data_age",
+        name="Data age",
+        icon="mdi:update",
+        value_fn=lambda telemetry, vin: telemetry.data_age(vin),
+        native_unit_of_measurement="s",
+        device_class=dc.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        translation_key="data_age",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+CHARGING_SENSOR_TYPES: tuple[AudiChargingSensorDescription, ...] = (
+    AudiChargingSensorDescription(
+        key="charging_session_energy",
+        name="Charging session: energy",
+        icon="mdi:lightning-bolt",
+        value_fn=lambda session, _: round(session.energy, 2),
+        native_unit_of_measurement="kWh",
+        device_class=dc.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        history=True,
+        translation_key="charging_session_energy",
+    ),
+    AudiChargingSensorDescription(
+        key="charging_session_average_power",
+        name="Charging session: average power",
+        icon="mdi:flash",
+        value_fn=lambda session, _: session.average_power,
+        native_unit_of_measurement="kW",
+        device_class=dc.POWER,
+        translation_key="charging_session_average_power",
+    ),
+    AudiChargingSensorDescription(
+        key="charging_session_soc_gained",
+        name="Charging session: state of charge gained",
+        icon="mdi:battery-plus",
+        value_fn=lambda session, _: session.soc_gained,
+        native_unit_of_measurement="%",
+        translation_key="charging_session_soc_gained",
+    ),
+    AudiChargingSensorDescription(
+        key="charging_session_duration",
+        name="Charging session: duration",
+        icon="mdi:timer-outline",
+        value_fn=lambda session, _: round(session.duration),
+        native_unit_of_measurement="min",
+        device_class=dc.DURATION,
+        translation_key="charging_session_duration",
+    ),
+    AudiChargingSensorDescription(
+        key="charging_session_cost",
+        name="Charging session: cost",
+        icon="mdi:cash",
+        value_fn=lambda session, _: round(session.cost, 2),
+        device_class=dc.MONETARY,
+        translation_key="charging_session_cost",
+    ),
+    AudiChargingSensorDescription(
+        key="charging_complete_eta",
+        name="Charging session: estimated completion",
+        icon="mdi:battery-clock",
+        value_fn=lambda session, capacity: session.eta(capacity),
+        device_class=dc.TIMESTAMP,
+        translation_key="charging_complete_eta",
+    ),
+    AudiChargingSensorDescription(
+        key="charging_session_efficiency",
+        name="Charging session: efficiency",
+        icon="mdi:battery-charging-high",
+        value_fn=lambda session, capacity: session.efficiency(capacity),
+        native_unit_of_measurement="%",
+        translation_key="charging_session_efficiency",
+        entity_registry_enabled_default=False,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: AudiConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up sensor."""
     coordinator = entry.runtime_data
-    entities = [
-        AudiSensor(coordinator, vehicle, description)
-        for description in SENSOR_TYPES
-        for vehicle in coordinator.data
-    ]
-    async_add_entities(entities)
+    async_add_entities(
+        AudiAccountSensor(coordinator, description)
+        for description in ACCOUNT_SENSOR_TYPES
+    )
+
+    @callback
+    def async_add_vehicles(vehicles: list[Vehicle]) -> None:
+        """Add entities of vehicles."""
+        entities = [
+            AudiSensor(coordinator, vehicle, description)
+            for description in SENSOR_TYPES
+            for vehicle in vehicles
+        ]
+        entities.extend(
+            AudiVehicleTelemetrySensor(coordinator, vehicle, description)
+            for description in VEHICLE_TELEMETRY_SENSOR_TYPES
+            for vehicle in vehicles
+        )
+        entities.extend(
+            AudiChargingSensor(coordinator, vehicle, description)
+            for description in CHARGING_SENSOR_TYPES
+            for vehicle in vehicles
+            if getattr(vehicle, "charging", None) is not None
+        )
+        async_add_entities(entities)
+
+    entry.async_on_unload(coordinator.async_add_vehicle_listener(async_add_vehicles))
 
 
 class AudiSensor(AudiEntity, SensorEntity):
     """Representation of a Audi sensor."""
 
+    _last_value: float | None = None
+    _last_value_time = 0.0
+
+    def __init__(
+        self,
+        coordinator: AudiDataUpdateCoordinator,
+        vehicle: Vehicle,
+        description: AudiSensorDescription,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, vehicle, description)
+        options = coordinator.options
+        self._threshold = options.get(CONF_THRESHOLDS, {}).get(
+            description.key, description.significant_change
+        )
+        self._max_age = 60 * options.get(
+            CONF_SIGNIFICANT_MAX_AGE, DEFAULT_SIGNIFICANT_MAX_AGE
+        )
+        # A held back change must still be written once it is too old.
+        self._skip_unchanged = not self._threshold
+
+    @callback
+    def _async_should_write_state(self) -> bool:
+        """Skip poll timestamps and insignificant changes."""
+        if (
+            self.entity_description.poll_timestamp
+            and self._last_written is not None
+            and self.vehicle.vin not in self.coordinator.changed_vins
+        ):
+            return False
+        if self._threshold and not self._is_significant():
+            return False
+        if not super()._async_should_write_state():
+            return False
+        if isinstance(value := self.state, int | float):
+            self._last_value = value
+            self._last_value_time = time.monotonic()
+        return True
+
+    def _is_significant(self) -> bool:
+        """Return True if the value moved beyond the threshold or became stale."""
+        value = self.state
+        if (
+            self._last_value is None
+            or not isinstance(value, int | float)
+            or not self.available
+            or time.monotonic() - self._last_value_time >= self._max_age
+        ):
+            return True
+        limit = self._threshold
+        if self.entity_description.significant_relative:
+            limit *= abs(self._last_value)
+        return abs(value - self._last_value) >= limit
+
     @property
     def state(self):
         """Return sensor state."""
@@ -297,3 +525,93 @@ class AudiSensor(AudiEntity, SensorEntity):
         if value is not None and self.entity_description.value_fn:
             return self.entity_description.value_fn(value)
         return value
+
+
+class AudiVehicleTelemetrySensor(AudiEntity, SensorEntity):
+    """Representation of a vehicle diagnostic sensor."""
+
+    _skip_unchanged = False
+
+    @property
+    def available(self) -> bool:
+        """Return True, telemetry remains available when polls fail."""
+        return True
+
+    @property
+    def native_value(self):
+        """Return sensor state."""
+        return self.entity_description.value_fn(
+            self.coordinator.telemetry, self.vehicle.vin
+        )
+
+
+class AudiChargingSensor(AudiEntity, SensorEntity):
+    """Representation of a charging session sensor."""
+
+    _skip_unchanged = False
+    _unrecorded_attributes = frozenset({"sessions"})
+
+    @property
+    def native_value(self):
+        """Return the value of the session in progress or the last one."""
+        if session := self.coordinator.charging.latest(self.vehicle.vin):
+            return self.entity_description.value_fn(
+                session, self.coordinator.charging.capacity
+            )
+        return None
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit, the currency for costs."""
+        if self.device_class == dc.MONETARY:
+            return self.hass.config.currency
+        return super().native_unit_of_measurement
+
+    @property
+    def extra_state_attributes(self):
+        """Return the session in progress and the history."""
+        if not self.entity_description.history:
+            return None
+        charging = self.coordinator.charging
+        return {
+            "charging": self.vehicle.vin in charging.current,
+            "sessions": [
+                session.as_dict()
+                for session in charging.history.get(self.vehicle.vin, ())
+            ],
+        }
+
+
+class AudiAccountSensor(CoordinatorEntity[AudiDataUpdateCoordinator], SensorEntity):
+    """Representation of an account diagnostic sensor."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: AudiDataUpdateCoordinator,
+        description: AudiTelemetrySensorDescription,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.entity_description = description
+
+        entry = coordinator.config_entry
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            configuration_url=URL_WEBSITE,
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer=MANUFACTURER,
+            name=entry.title,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True, telemetry remains available when polls fail."""
+        return True
+
+    @property
+    def native_value(self):
+        """Return sensor state."""
+        return self.entity_description.value_fn(self.coordinator.telemetry, None)
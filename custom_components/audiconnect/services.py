@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
+import os
+from typing import TYPE_CHECKING
 
 from audiconnectpy import AudiException
-from audiconnectpy.vehicle import Vehicle
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, Unauthorized, UnknownUser
 from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.util import dt as dt_util
 
 from .const import CONF_ACTION, CONF_VIN, DOMAIN
-from .coordinator import AudiDataUpdateCoordinator
+from .history import PositionTrack, iter_geojson, iter_gpx
+from .registry import async_get_vehicle_registry
+
+if TYPE_CHECKING:
+    from cProfile import Profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,45 +43,94 @@ SCHEMA_ACTION = vol.Schema(
     {vol.Required(CONF_VIN): cv.string, vol.Required(CONF_ACTION): cv.string}
 )
 
+SERVICE_PROFILE_POLL = "profile_poll"
+SCHEMA_PROFILE_POLL = vol.Schema(
+    {
+        vol.Optional(CONF_VIN): cv.string,
+        vol.Optional("force", default=True): cv.boolean,
+        vol.Optional("top", default=20): vol.All(vol.Coerce(int), vol.Range(1, 200)),
+    }
+)
+
+SERVICE_EXPORT_POSITIONS = "export_positions"
+SCHEMA_EXPORT_POSITIONS = vol.Schema(
+    {
+        vol.Required(CONF_VIN): cv.string,
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("format", default="gpx"): vol.In(["gpx", "geojson"]),
+    }
+)
 
-async def async_setup_services(
-    hass: HomeAssistant, coordinator: AudiDataUpdateCoordinator
-):
-    """Register services."""
+SERVICE_CLEAR_CACHE = "clear_cache"
+SCHEMA_CLEAR_CACHE = vol.Schema({vol.Optional(CONF_VIN): cv.string})
 
-    def search_vehicle(vin: str) -> Vehicle:
-        """Return vehicle object."""
-        for vehicle in coordinator.api.vehicles:
-            if vehicle.vin == vin:
-                return vehicle
+
+def _export_positions(
+    track: PositionTrack,
+    path: str,
+    name: str,
+    file_format: str,
+    start: datetime | None,
+    end: datetime | None,
+) -> int:
+    """Stream the points of a time range to a file and return their count."""
+    count = 0
+
+    def points():
+        nonlocal count
+        for point in track.between(start, end):
+            count += 1
+            yield point
+
+    writer = iter_gpx if file_format == "gpx" else iter_geojson
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(writer(name, points()))
+    return count
+
+
+def _dump_profile(profiler: Profile, path: str, top: int) -> list[dict]:
+    """Write pstats file and return the hottest functions."""
+    from pstats import Stats  # pylint: disable=import-outside-toplevel
+
+    profiler.dump_stats(path)
+    stats = Stats(profiler).sort_stats("cumulative")
+    hot_functions = []
+    for func in stats.fcn_list[:top]:
+        _, calls, tottime, cumtime, _ = stats.stats[func]
+        filename, line, name = func
+        hot_functions.append(
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": calls,
+                "tottime": round(tottime, 6),
+                "cumtime": round(cumtime, 6),
+            }
+        )
+    return hot_functions
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register services, shared by all entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH_DATA):
+        return
+    registry = async_get_vehicle_registry(hass)
 
     async def async_refresh_data(call: ServiceCall) -> None:
-        device_id = call.data.get(CONF_VIN).lower()
-        device = dr.async_get(hass).async_get(device_id)
-        vin = dict(device.identifiers).get(DOMAIN)
-        vehicle = search_vehicle(vin)
+        coordinator, vehicle = registry.async_resolve(call.data[CONF_VIN])
         await vehicle.async_refresh_vehicle_data()
-        await coordinator.async_request_refresh()
+        await coordinator.async_wake(vehicle.vin)
 
     async def async_turn_off_action(call: ServiceCall) -> None:
-        device_id = call.data[CONF_VIN].lower()
-        action = call.data[CONF_ACTION]
-        device = dr.async_get(hass).async_get(device_id)
-        vin = dict(device.identifiers).get(DOMAIN)
-
-        await async_actions(vin, action, False)
+        await async_actions(call.data[CONF_VIN], call.data[CONF_ACTION], False)
 
     async def async_turn_on_action(call: ServiceCall) -> None:
-        device_id = call.data[CONF_VIN].lower()
-        action = call.data[CONF_ACTION]
-        device = dr.async_get(hass).async_get(device_id)
-        vin = dict(device.identifiers).get(DOMAIN)
+        await async_actions(call.data[CONF_VIN], call.data[CONF_ACTION], True)
 
-        await async_actions(vin, action, True)
-
-    async def async_actions(vin: str, action: str, mode: bool):
+    async def async_actions(target: str, action: str, mode: bool):
         """Execute action."""
-        vehicle = search_vehicle(vin)
+        coordinator, vehicle = registry.async_resolve(target)
         try:
             match action:
                 case "lock":
@@ -85,7 +148,77 @@ async def async_setup_services(
         except AudiException as error:
             _LOGGER.error(error)
         else:
-            await coordinator.async_request_refresh()
+            await coordinator.async_wake(vehicle.vin)
+
+    async def async_profile_poll(call: ServiceCall) -> ServiceResponse:
+        """Profile a poll cycle."""
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None:
+                raise UnknownUser(context=call.context)
+            if not user.is_admin:
+                raise Unauthorized(context=call.context)
+
+        if target := call.data.get(CONF_VIN):
+            coordinator, _ = registry.async_resolve(target)
+        elif registry.coordinators:
+            coordinator = next(iter(registry.coordinators.values()))
+        else:
+            raise HomeAssistantError("No account loaded")
+
+        try:
+            profiler = await coordinator.async_profile_refresh(call.data["force"])
+        except TimeoutError as error:
+            raise HomeAssistantError("No poll cycle happened in time") from error
+        except ValueError as error:
+            raise HomeAssistantError(f"Unable to start profiler: {error}") from error
+
+        path = hass.config.path(
+            f"{DOMAIN}_profile_{dt_util.now().strftime('%Y%m%d%H%M%S')}.prof"
+        )
+        hot_functions = await hass.async_add_executor_job(
+            _dump_profile, profiler, path, call.data["top"]
+        )
+        return {"file": path, "functions": hot_functions}
+
+    async def async_export_positions(call: ServiceCall) -> ServiceResponse:
+        """Export the position history of a vehicle."""
+        coordinator, vehicle = registry.async_resolve(call.data[CONF_VIN])
+        vin = vehicle.vin
+        if (track := coordinator.positions.tracks.get(vin)) is None:
+            raise HomeAssistantError("No position recorded for this vehicle")
+
+        start = call.data.get("start")
+        end = call.data.get("end")
+        if start:
+            start = dt_util.as_utc(start)
+        if end:
+            end = dt_util.as_utc(end)
+        file_format = call.data["format"]
+        path = hass.config.path(
+            DOMAIN,
+            f"{vin.lower()}_{dt_util.now().strftime('%Y%m%d%H%M%S')}.{file_format}",
+        )
+        device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, vin)})
+        count = await hass.async_add_executor_job(
+            _export_positions,
+            track.copy(),
+            path,
+            (device and (device.name_by_user or device.name)) or vin,
+            file_format,
+            start,
+            end,
+        )
+        return {"file": path, "points": count}
+
+    async def async_clear_cache(call: ServiceCall) -> None:
+        """Invalidate cached vehicle metadata."""
+        if target := call.data.get(CONF_VIN):
+            coordinator, vehicle = registry.async_resolve(target)
+            coordinator.async_invalidate_metadata(vehicle.vin)
+            return
+        for coordinator in registry.coordinators.values():
+            coordinator.async_invalidate_metadata()
 
     hass.services.async_register(
         DOMAIN, SERVICE_REFRESH_DATA, async_refresh_data, schema=SCHEMA_REFRESH_DATA
@@ -96,3 +229,35 @@ async def async_setup_services(
     hass.services.async_register(
         DOMAIN, SERVICE_TURN_OFF, async_turn_off_action, schema=SCHEMA_ACTION
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_POLL,
+        async_profile_poll,
+        schema=SCHEMA_PROFILE_POLL,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_CLEAR_CACHE, async_clear_cache, schema=SCHEMA_CLEAR_CACHE
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_POSITIONS,
+        async_export_positions,
+        schema=SCHEMA_EXPORT_POSITIONS,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Unregister the services once the last entry is unloaded."""
+    for service in (
+        SERVICE_REFRESH_DATA,
+        SERVICE_TURN_ON,
+        SERVICE_TURN_OFF,
+        SERVICE_PROFILE_POLL,
+        SERVICE_CLEAR_CACHE,
+        SERVICE_EXPORT_POSITIONS,
+    ):
+        if hass.services.has_service(DOMAIN, service):
+            hass.services.async_remove(DOMAIN, service)
@@ -0,0 +1,229 @@
+"""Long-term statistics for Audi connect."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any
+
+from audiconnectpy.vehicle import Vehicle
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+MAX_PENDING = timedelta(days=3)
+
+
+@dataclass(frozen=True)
+class AudiStatisticDescription:
+    """Describes a long-term statistic."""
+
+    key: str
+    name: str
+    value: str
+    unit: str
+    has_sum: bool = False
+
+
+STATISTIC_TYPES: tuple[AudiStatisticDescription, ...] = (
+    AudiStatisticDescription(
+        key="odometer",
+        name="Odometer",
+        value="measurements.odometer_status.odometer",
+        unit="km",
+        has_sum=True,
+    ),
+    AudiStatisticDescription(
+        key="battery_level",
+        name="Battery level",
+        value="charging.battery_status.current_soc_pct",
+        unit="%",
+    ),
+    AudiStatisticDescription(
+        key="electric_range",
+        name="Electric range",
+        value="measurements.range_status.electric_range",
+        unit="km",
+    ),
+    AudiStatisticDescription(
+        key="gasoline_range",
+        name="Gasoline range",
+        value="measurements.range_status.gasoline_range",
+        unit="km",
+    ),
+    AudiStatisticDescription(
+        key="cruising_range_electric",
+        name="Cruising range electric",
+        value="charging.battery_status.cruising_range_electric_km",
+        unit="km",
+    ),
+)
+
+
+def statistic_id(vin: str, description: AudiStatisticDescription) -> str:
+    """Return the external statistic id."""
+    return f"{DOMAIN}:{vin.lower()}_{description.key}"
+
+
+class LongTermStatistics:
+    """Aggregate samples per hour and import them as external statistics.
+
+    The hour in progress is persisted, so hours interrupted by a restart are
+    imported when the integration is loaded again. Hours that could not be
+    imported within three days, without the recorder, are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._entry = entry
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.statistics"
+        )
+        self._hours: dict[str, dict[str, Any]] = {}
+        self._metadata: dict[str, StatisticMetaData] = {}
+        self._sums: dict[str, dict[str, float]] = {}
+        self._seeding: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the persisted hours and import those already completed."""
+        if data := await self._store.async_load():
+            self._hours = data["hours"]
+            self._metadata = data["metadata"]
+            self._sums = data.get("sums", {})
+            for stat_id, metadata in self._metadata.items():
+                if metadata["has_sum"] and stat_id not in self._sums:
+                    await self._async_seed_sum(stat_id)
+            self._async_import(dt_util.utcnow())
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_add_samples(self, vehicles: list[Vehicle]) -> None:
+        """Add a sample of each statistic of each vehicle."""
+        now = dt_util.utcnow()
+        hour = now.replace(minute=0, second=0, microsecond=0).isoformat()
+        for vehicle in vehicles:
+            for description in STATISTIC_TYPES:
+                try:
+                    value = attrgetter(description.value)(vehicle)
+                except AttributeError:
+                    continue
+                if not isinstance(value, int | float) or isinstance(value, bool):
+                    continue
+
+                stat_id = statistic_id(vehicle.vin, description)
+                if stat_id not in self._metadata:
+                    self._metadata[stat_id] = StatisticMetaData(
+                        has_mean=not description.has_sum,
+                        has_sum=description.has_sum,
+                        name=f"{vehicle.infos.media.short_name} {description.name}",
+                        source=DOMAIN,
+                        statistic_id=stat_id,
+                        unit_of_measurement=description.unit,
+                    )
+                    if description.has_sum:
+                        self._seeding.add(stat_id)
+                        self._entry.async_create_background_task(
+                            self.hass,
+                            self._async_seed_sum(stat_id),
+                            f"{DOMAIN} seed {stat_id}",
+                        )
+                bucket = self._hours.setdefault(stat_id, {}).setdefault(
+                    hour, {"count": 0, "total": 0.0, "min": value, "max": value}
+                )
+                bucket["count"] += 1
+                bucket["total"] += value
+                bucket["min"] = min(bucket["min"], value)
+                bucket["max"] = max(bucket["max"], value)
+                bucket["last"] = value
+
+        self._async_import(now)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _async_import(self, now: datetime) -> None:
+        """Import completed hours in bulk and drop those left too long."""
+        hour_start = now.replace(minute=0, second=0, microsecond=0)
+        stale = (hour_start - MAX_PENDING).isoformat()
+        self._hours = {
+            stat_id: kept
+            for stat_id, hours in self._hours.items()
+            if (kept := {hour: item for hour, item in hours.items() if hour >= stale})
+        }
+        if "recorder" not in self.hass.config.components:
+            return
+        current = hour_start.isoformat()
+        for stat_id, hours in self._hours.items():
+            completed = sorted(hour for hour in hours if hour < current)
+            if not completed or stat_id in self._seeding:
+                continue
+            metadata = self._metadata[stat_id]
+            running = self._sums.get(stat_id)
+            statistics = []
+            for hour in completed:
+                bucket = hours.pop(hour)
+                start = dt_util.parse_datetime(hour)
+                if metadata["has_sum"]:
+                    # The sum grows from the first imported state.
+                    if running is None:
+                        running = {"state": bucket["min"], "sum": 0.0}
+                    running["sum"] += max(0.0, bucket["last"] - running["state"])
+                    running["state"] = bucket["last"]
+                    statistics.append(
+                        StatisticData(
+                            start=start, state=bucket["last"], sum=running["sum"]
+                        )
+                    )
+                else:
+                    statistics.append(
+                        StatisticData(
+                            start=start,
+                            mean=bucket["total"] / bucket["count"],
+                            min=bucket["min"],
+                            max=bucket["max"],
+                        )
+                    )
+            if running is not None:
+                self._sums[stat_id] = running
+            _LOGGER.debug("Import %s hours of %s", len(statistics), stat_id)
+            async_add_external_statistics(self.hass, metadata, statistics)
+
+    async def _async_seed_sum(self, stat_id: str) -> None:
+        """Continue the sum from the last imported statistic, if any."""
+        try:
+            if "recorder" not in self.hass.config.components:
+                return
+            last = await get_instance(self.hass).async_add_executor_job(
+                get_last_statistics, self.hass, 1, stat_id, True, {"state", "sum"}
+            )
+            if (rows := last.get(stat_id)) and rows[0].get("state") is not None:
+                self._sums[stat_id] = {
+                    "state": rows[0]["state"],
+                    "sum": rows[0].get("sum") or 0.0,
+                }
+        finally:
+            self._seeding.discard(stat_id)
+
+    async def async_save(self) -> None:
+        """Write the data now, cancelling a delayed save."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to persist."""
+        return {"hours": self._hours, "metadata": self._metadata, "sums": self._sums}
@@ -5,9 +5,10 @@ from __future__ import annotations
 import logging
 
 from audiconnectpy import AudiException
+from audiconnectpy.vehicle import Vehicle
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AudiConfigEntry
@@ -45,13 +46,16 @@ async def async_setup_entry(
     """Set up the switch."""
     coordinator = entry.runtime_data
 
-    entities = [
-        AudiSwitch(coordinator, vehicle, description)
-        for description in SENSOR_TYPES
-        for vehicle in coordinator.data
-    ]
+    @callback
+    def async_add_vehicles(vehicles: list[Vehicle]) -> None:
+        """Add entities of vehicles."""
+        async_add_entities(
+            AudiSwitch(coordinator, vehicle, description)
+            for description in SENSOR_TYPES
+            for vehicle in vehicles
+        )
 
-    async_add_entities(entities)
+    entry.async_on_unload(coordinator.async_add_vehicle_listener(async_add_vehicles))
 
 
 class AudiSwitch(AudiEntity, SwitchEntity):
@@ -69,7 +73,7 @@ class AudiSwitch(AudiEntity, SwitchEntity):
         """Turn the switch on."""
         try:
             await getattr(self.vehicle, self.entity_description.turn_mode)(True)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_wake(self.vehicle.vin)
         except AudiException as error:
             _LOGGER.error("Error to turn on : %s", error)
 
@@ -77,6 +81,6 @@ class AudiSwitch(AudiEntity, SwitchEntity):
         """Turn the switch off."""
         try:
             await getattr(self.vehicle, self.entity_description.turn_mode)(False)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_wake(self.vehicle.vin)
         except AudiException as error:
             _LOGGER.error("Error to turn off : %s", error)
@@ -0,0 +1,313 @@
+"""Poll cycle telemetry for Audi connect."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceResponseChunkReceivedParams,
+)
+from homeassistant.util import dt as dt_util
+from yarl import URL
+
+_LOGGER = logging.getLogger(__name__)
+
+TELEMETRY_WINDOW = 50
+REQUESTS_WINDOW = 3600
+BLOCKING_THRESHOLD = 0.1
+PROBE_INTERVAL = 0.05
+
+_VIN = re.compile(r"^[A-HJ-NPR-Z0-9]{17}$", re.IGNORECASE)
+_ID = re.compile(r"^(?:\d+|[0-9a-f-]{16,})$", re.IGNORECASE)
+
+
+def endpoint_template(url: URL) -> str:
+    """Return the endpoint of an url without query, vin and identifiers."""
+    segments = (
+        "{vin}" if _VIN.match(segment) else "{id}" if _ID.match(segment) else segment
+        for segment in url.path.split("/")
+    )
+    return f"{url.host}{'/'.join(segments)}"
+
+
+def mask_vin(vin: str) -> str:
+    """Return vin with only the last four characters visible."""
+    return f"{'*' * (len(vin) - 4)}{vin[-4:]}"
+
+
+def _p95(ordered: list[float]) -> float:
+    """Return the 95th percentile of a sorted list."""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def _summary(values: list[float]) -> dict[str, float | None]:
+    """Return last, mean, p95 and max of a list of durations."""
+    if not values:
+        return {"last": None, "mean": None, "p95": None, "max": None}
+    ordered = sorted(values)
+    return {
+        "last": round(values[-1], 3),
+        "mean": round(sum(values) / len(values), 3),
+        "p95": round(_p95(ordered), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+@dataclass
+class PollCycle:
+    """Statistics of one poll cycle."""
+
+    started: float
+    duration: float = 0.0
+    login: float = 0.0
+    vehicles: dict[str, float] = field(default_factory=dict)
+    requests: Counter[str] = field(default_factory=Counter)
+    payload_bytes: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+    fanout: float = 0.0
+    success: bool = False
+    excluded: int = 0
+
+
+class PollTelemetry:
+    """Rolling statistics of the last poll cycles."""
+
+    def __init__(self, window: int = TELEMETRY_WINDOW) -> None:
+        """Initialize."""
+        self.cycles: deque[PollCycle] = deque(maxlen=window)
+        self.requests_total: Counter[str] = Counter()
+        self.errors_total = 0
+        self.consecutive_failures = 0
+        self.p95_duration: float | None = None
+        self.vehicle_updated: dict[str, datetime] = {}
+        self.excluded_total = 0
+        self._request_times: deque[float] = deque()
+        self._current: PollCycle | None = None
+        self.loop_blocking: dict[str, dict[str, float]] = {}
+        self._step = "poll"
+        self._probe: asyncio.TimerHandle | None = None
+
+    @property
+    def last(self) -> PollCycle | None:
+        """Return the last completed cycle."""
+        return self.cycles[-1] if self.cycles else None
+
+    @property
+    def last_duration(self) -> float | None:
+        """Return duration of the last cycle."""
+        return round(last.duration, 3) if (last := self.last) else None
+
+    @property
+    def requests_last_hour(self) -> int:
+        """Return the number of requests sent during the last hour."""
+        limit = time.monotonic() - REQUESTS_WINDOW
+        while self._request_times and self._request_times[0] < limit:
+            self._request_times.popleft()
+        return len(self._request_times)
+
+    def data_age(self, vin: str) -> float | None:
+        """Return seconds elapsed since the last successful update of a vehicle."""
+        if (updated := self.vehicle_updated.get(vin)) is None:
+            return None
+        return round((dt_util.utcnow() - updated).total_seconds())
+
+    @contextmanager
+    def cycle(self) -> Iterator[PollCycle]:
+        """Measure a poll cycle."""
+        self._current = current = PollCycle(started=time.time())
+        start = time.perf_counter()
+        self._schedule_probe(asyncio.get_running_loop())
+        try:
+            yield current
+        except Exception:
+            # The failure was already counted if a request of the cycle failed.
+            if not current.errors:
+                self._count_error()
+            self.consecutive_failures += 1
+            raise
+        else:
+            current.success = True
+            self.consecutive_failures = 0
+        finally:
+            if self._probe:
+                self._probe.cancel()
+                self._probe = None
+            current.duration = time.perf_counter() - start
+            self.cycles.append(current)
+            self.p95_duration = round(
+                _p95(sorted(cycle.duration for cycle in self.cycles)), 3
+            )
+            self._current = None
+
+    @contextmanager
+    def measure_login(self) -> Iterator[None]:
+        """Measure login time."""
+        start = time.perf_counter()
+        self._step = "login"
+        try:
+            yield
+        finally:
+            self._step = "poll"
+            if self._current:
+                self._current.login = time.perf_counter() - start
+
+    @contextmanager
+    def measure_vehicle(self, vin: str) -> Iterator[None]:
+        """Measure update time of a vehicle."""
+        start = time.perf_counter()
+        self._step = "vehicle update"
+        try:
+            yield
+        finally:
+            self._step = "poll"
+            if self._current:
+                self._current.vehicles[vin] = time.perf_counter() - start
+        self.vehicle_updated[vin] = dt_util.utcnow()
+
+    def exclude_vehicle(self, vin: str) -> None:
+        """Count a vehicle skipped because it is not managed by the entry."""
+        self.excluded_total += 1
+        if self._current:
+            self._current.excluded += 1
+
+    @contextmanager
+    def measure_fanout(self) -> Iterator[None]:
+        """Measure time spent to notify entities of the last cycle."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if last := self.last:
+                last.fanout = elapsed
+            self._check_blocking("fan-out", elapsed)
+
+    @contextmanager
+    def measure_blocking(self, step: str) -> Iterator[None]:
+        """Check a synchronous step does not hold the event loop too long."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._check_blocking(step, time.perf_counter() - start)
+
+    def _schedule_probe(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Schedule the next event loop lag probe."""
+        expected = loop.time() + PROBE_INTERVAL
+        self._probe = loop.call_at(expected, self._run_probe, loop, expected)
+
+    def _run_probe(self, loop: asyncio.AbstractEventLoop, expected: float) -> None:
+        """Measure how late the probe ran and schedule the next one."""
+        self._check_blocking(self._step, loop.time() - expected)
+        self._schedule_probe(loop)
+
+    def _check_blocking(self, step: str, elapsed: float) -> None:
+        """Record and log a step which blocked the event loop."""
+        if elapsed < BLOCKING_THRESHOLD:
+            return
+        stats = self.loop_blocking.setdefault(step, {"count": 0, "max": 0.0})
+        stats["count"] += 1
+        stats["max"] = round(max(stats["max"], elapsed), 3)
+        # Warn once per step, repeated warnings would flood the log.
+        _LOGGER.log(
+            logging.WARNING if stats["count"] == 1 else logging.DEBUG,
+            "Event loop blocked for %.3f s during %s",
+            elapsed,
+            step,
+        )
+
+    def create_trace_config(self) -> TraceConfig:
+        """Return an aiohttp trace config counting requests and payloads."""
+        trace_config = TraceConfig()
+        trace_config.on_request_end.append(self._async_on_request_end)
+        trace_config.on_request_exception.append(self._async_on_request_exception)
+        trace_config.on_response_chunk_received.append(self._async_on_chunk_received)
+        return trace_config
+
+    async def _async_on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        """Count a request."""
+        endpoint = f"{params.method} {endpoint_template(params.url)}"
+        self.requests_total[endpoint] += 1
+        self._request_times.append(time.monotonic())
+        if self._current:
+            self._current.requests[endpoint] += 1
+        if params.response.status >= 400:
+            self._count_error()
+
+    async def _async_on_request_exception(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestExceptionParams,
+    ) -> None:
+        """Count a failed request."""
+        self._count_error()
+
+    def _count_error(self) -> None:
+        """Count a failure once, in the total and in the current cycle."""
+        self.errors_total += 1
+        if self._current:
+            self._current.errors += 1
+
+    async def _async_on_chunk_received(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        """Count payload size."""
+        if self._current:
+            endpoint = f"{params.method} {endpoint_template(params.url)}"
+            self._current.payload_bytes[endpoint] += len(params.chunk)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return statistics for diagnostics."""
+        cycles = list(self.cycles)
+        vehicles: dict[str, list[float]] = {}
+        requests: Counter[str] = Counter()
+        payload_bytes: Counter[str] = Counter()
+        for cycle in cycles:
+            for vin, duration in cycle.vehicles.items():
+                vehicles.setdefault(mask_vin(vin), []).append(duration)
+            requests.update(cycle.requests)
+            payload_bytes.update(cycle.payload_bytes)
+
+        return {
+            "cycles": len(cycles),
+            "failed_cycles": sum(1 for cycle in cycles if not cycle.success),
+            "errors": sum(cycle.errors for cycle in cycles),
+            "errors_total": self.errors_total,
+            "consecutive_failures": self.consecutive_failures,
+            "requests_last_hour": self.requests_last_hour,
+            "vehicles_excluded": last.excluded if (last := self.last) else 0,
+            "vehicle_updates_skipped_total": self.excluded_total,
+            "cycle_time": _summary([cycle.duration for cycle in cycles]),
+            "login_time": _summary([cycle.login for cycle in cycles]),
+            "fanout_time": _summary([cycle.fanout for cycle in cycles]),
+            "vehicle_update_time": {
+                vin: _summary(durations) for vin, durations in vehicles.items()
+            },
+            "requests": dict(requests),
+            "payload_bytes": dict(payload_bytes),
+            "requests_total": dict(self.requests_total),
+            "loop_blocking": self.loop_blocking,
+        }
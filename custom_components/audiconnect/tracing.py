@@ -0,0 +1,215 @@
+"""HTTP request tracing for Audi connect."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsResolveHostEndParams,
+    TraceDnsResolveHostStartParams,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestHeadersSentParams,
+    TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+)
+
+from .telemetry import endpoint_template
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class EndpointTiming:
+    """Aggregated timings of an endpoint."""
+
+    count: int = 0
+    reused: int = 0
+    errors: int = 0
+    dns: float = 0.0
+    connect: float = 0.0
+    ttfb: float = 0.0
+    ttfb_max: float = 0.0
+    total: float = 0.0
+    total_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return mean and max timings."""
+        count = self.count or 1
+        return {
+            "count": self.count,
+            "reused": self.reused,
+            "errors": self.errors,
+            "dns_mean": round(self.dns / count, 3),
+            "connect_mean": round(self.connect / count, 3),
+            "ttfb_mean": round(self.ttfb / count, 3),
+            "ttfb_max": round(self.ttfb_max, 3),
+            "total_mean": round(self.total / count, 3),
+            "total_max": round(self.total_max, 3),
+        }
+
+
+class RequestTracer:
+    """Record DNS, connect, time to first byte and total time per endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.endpoints: dict[str, EndpointTiming] = {}
+
+    def create_trace_config(self) -> TraceConfig:
+        """Return an aiohttp trace config."""
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._async_on_request_start)
+        trace_config.on_dns_resolvehost_start.append(self._async_on_dns_start)
+        trace_config.on_dns_resolvehost_end.append(self._async_on_dns_end)
+        trace_config.on_connection_create_start.append(self._async_on_connect_start)
+        trace_config.on_connection_create_end.append(self._async_on_connect_end)
+        trace_config.on_connection_reuseconn.append(self._async_on_reuseconn)
+        trace_config.on_request_headers_sent.append(self._async_on_headers_sent)
+        trace_config.on_request_end.append(self._async_on_request_end)
+        trace_config.on_request_exception.append(self._async_on_request_exception)
+        trace_config.on_response_chunk_received.append(self._async_on_chunk_received)
+        return trace_config
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return aggregated timings for diagnostics."""
+        return {
+            endpoint: timing.as_dict() for endpoint, timing in self.endpoints.items()
+        }
+
+    async def _async_on_request_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        """Start timing a request."""
+        context.start = context.sent = time.perf_counter()
+        context.dns = context.connect = 0.0
+        context.reused = False
+        context.timing = None
+
+    async def _async_on_dns_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceDnsResolveHostStartParams,
+    ) -> None:
+        """Start timing DNS resolution."""
+        context.dns_start = time.perf_counter()
+
+    async def _async_on_dns_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceDnsResolveHostEndParams,
+    ) -> None:
+        """Stop timing DNS resolution."""
+        context.dns = time.perf_counter() - context.dns_start
+
+    async def _async_on_connect_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateStartParams,
+    ) -> None:
+        """Start timing connection (DNS and TLS included)."""
+        context.connect_start = time.perf_counter()
+
+    async def _async_on_connect_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ) -> None:
+        """Stop timing connection."""
+        context.connect = time.perf_counter() - context.connect_start
+
+    async def _async_on_reuseconn(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ) -> None:
+        """Flag a reused connection."""
+        context.reused = True
+
+    async def _async_on_headers_sent(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestHeadersSentParams,
+    ) -> None:
+        """Mark the request as sent."""
+        context.sent = time.perf_counter()
+
+    async def _async_on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        """Record timings once response headers are received."""
+        now = time.perf_counter()
+        endpoint = f"{params.method} {endpoint_template(params.url)}"
+        timing = self.endpoints.setdefault(endpoint, EndpointTiming())
+        ttfb = now - context.sent
+        total = now - context.start
+
+        timing.count += 1
+        timing.reused += context.reused
+        timing.errors += params.response.status >= 400
+        timing.dns += context.dns
+        timing.connect += context.connect
+        timing.ttfb += ttfb
+        timing.ttfb_max = max(timing.ttfb_max, ttfb)
+        timing.total += total
+        timing.total_max = max(timing.total_max, total)
+
+        context.timing = timing
+        context.total = total
+
+        _LOGGER.debug(
+            "%s: status=%s reused=%s dns=%.3fs connect=%.3fs ttfb=%.3fs",
+            endpoint,
+            params.response.status,
+            context.reused,
+            context.dns,
+            context.connect,
+            ttfb,
+        )
+
+    async def _async_on_request_exception(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestExceptionParams,
+    ) -> None:
+        """Record a failed request."""
+        endpoint = f"{params.method} {endpoint_template(params.url)}"
+        timing = self.endpoints.setdefault(endpoint, EndpointTiming())
+        timing.errors += 1
+        _LOGGER.debug("%s: %s", endpoint, type(params.exception).__name__)
+
+    async def _async_on_chunk_received(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        """Extend total time until the last chunk of the body."""
+        if (timing := getattr(context, "timing", None)) is None:
+            return
+        total = time.perf_counter() - context.start
+        timing.total += total - context.total
+        timing.total_max = max(timing.total_max, total)
+        context.total = total
@@ -0,0 +1,54 @@
+"""Push updates of Audi connect vehicles through a webhook."""
+
+from __future__ import annotations
+
+import logging
+from http import HTTPStatus
+
+from aiohttp import hdrs, web
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
+from .scheduler import SELECTIVE_STATUS_JOBS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def async_setup_webhook(
+    hass: HomeAssistant, entry: ConfigEntry, webhook_id: str
+) -> None:
+    """Register the push webhook of a config entry."""
+
+    async def async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Apply a pushed selective status to a vehicle."""
+        try:
+            body = await request.json(loads=json_loads)
+            vin = body["vin"]
+            payload = body["data"]
+        except (ValueError, KeyError, TypeError):
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        if not isinstance(payload, dict) or not payload.keys() <= set(
+            SELECTIVE_STATUS_JOBS
+        ):
+            _LOGGER.debug("Push update rejected, unknown status domains")
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+        if not entry.runtime_data.async_apply_push(vin, payload):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.Response(status=HTTPStatus.OK)
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        webhook_id,
+        async_handle_webhook,
+        local_only=True,
+        allowed_methods=[hdrs.METH_POST],
+    )
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
@@ -0,0 +1,38 @@
+"""Tests of the cassette redaction."""
+
+from yarl import URL
+
+from custom_components.audiconnect.cassette import REDACTED, redact_url
+
+REDIRECT = (
+    "myaudi:///?code=secret-code&state=secret-state&lang=en"
+    "#access_token=secret-access&id_token=secret-id&expires_in=3600"
+)
+
+
+def test_redact_url_redirect_with_tokens() -> None:
+    """Codes and tokens of an OAuth redirect are redacted."""
+    redacted = redact_url(URL(REDIRECT))
+
+    assert "secret" not in redacted
+    url = URL(redacted)
+    assert url.query["code"] == REDACTED
+    assert url.query["state"] == REDACTED
+    assert url.query["lang"] == "en"
+    fragment = URL(f"?{url.fragment}").query
+    assert fragment["access_token"] == REDACTED
+    assert fragment["id_token"] == REDACTED
+    assert fragment["expires_in"] == "3600"
+
+
+def test_redact_url_drops_opaque_fragment() -> None:
+    """Fragments that are not parameters are dropped."""
+    assert redact_url(URL("https://example.com/login#secret")) == (
+        "https://example.com/login"
+    )
+
+
+def test_redact_url_keeps_plain_url() -> None:
+    """Urls without parameters are unchanged."""
+    url = "https://example.com/vehicles/status"
+    assert redact_url(URL(url)) == url